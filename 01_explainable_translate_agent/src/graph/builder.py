@@ -32,7 +32,6 @@ Strands GraphBuilder 기반 워크플로우 빌더
 """
 
 import logging
-from datetime import datetime
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
@@ -62,9 +61,9 @@ from src.graph.nodes import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranslationWorkflowConfig:
-    """번역 워크플로우 설정"""
+    """번역 워크플로우 설정 (불변)"""
     max_regenerations: int = 1
     num_candidates: int = 1
     enable_backtranslation: bool = True
@@ -72,7 +71,7 @@ class TranslationWorkflowConfig:
     max_node_executions: int = 15  # 무한 루프 방지
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowMetrics:
     """워크플로우 메트릭"""
     total_latency_ms: int = 0
@@ -192,8 +191,6 @@ class TranslationWorkflowGraphV2:
         Returns:
             최종 워크플로우 상태 딕셔너리
         """
-        start_time = datetime.now()
-
         # 워크플로우 상태 생성
         workflow_config = WorkflowConfig(
             max_regenerations=self.config.max_regenerations,
@@ -219,9 +216,9 @@ class TranslationWorkflowGraphV2:
             state["workflow_state"] = WorkflowState.FAILED
             state["error"] = str(e)
 
-        # 메트릭 계산
-        end_time = datetime.now()
-        state["metrics"] = self._calculate_metrics(state, start_time, end_time)
+        # 메트릭 계산 (워크플로우 생성 시점부터의 monotonic 경과 시간)
+        total_latency = self.state_manager.get_elapsed_ms(workflow_id)
+        state["metrics"] = self._calculate_metrics(state, total_latency)
 
         # 정리
         final_state = self.state_manager.cleanup(workflow_id)
@@ -237,11 +234,9 @@ class TranslationWorkflowGraphV2:
     def _calculate_metrics(
         self,
         state: Dict[str, Any],
-        start_time: datetime,
-        end_time: datetime
+        total_latency: int
     ) -> WorkflowMetrics:
         """워크플로우 메트릭 계산 (기존 로직 유지)"""
-        total_latency = int((end_time - start_time).total_seconds() * 1000)
 
         translation_latency = 0
         backtranslation_latency = 0
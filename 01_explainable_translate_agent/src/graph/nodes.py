@@ -36,7 +36,7 @@ from src.tools import (
 from sops.evaluation_gate import EvaluationGateSOP, EvaluationGateConfig
 from sops.regeneration import RegenerationSOP
 from src.utils.config import get_glossary, get_style_guide, get_risk_profile
-from src.utils.workflow_state import get_workflow_state, is_workflow_failed
+from src.utils.workflow_state import get_workflow_state, is_workflow_failed, resolve_unit
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +52,7 @@ async def translate_node(task=None, **kwargs) -> Dict[str, Any]:
     """
     try:
         state = get_workflow_state()
-        unit: TranslationUnit = state["unit"]
+        unit: TranslationUnit = resolve_unit(state)
         feedback: Optional[str] = state.get("feedback")
         num_candidates: int = state.get("num_candidates", 1)
 
@@ -101,7 +101,7 @@ async def backtranslate_node(task=None, **kwargs) -> Dict[str, Any]:
     try:
         state = get_workflow_state()
         translation_result: TranslationResult = state["translation_result"]
-        unit: TranslationUnit = state["unit"]
+        unit: TranslationUnit = resolve_unit(state)
 
         text_to_backtranslate = translation_result.translation
 
@@ -137,7 +137,7 @@ async def evaluate_node(task=None, **kwargs) -> Dict[str, Any]:
     """
     try:
         state = get_workflow_state()
-        unit: TranslationUnit = state["unit"]
+        unit: TranslationUnit = resolve_unit(state)
         translation_result: TranslationResult = state["translation_result"]
         backtranslation_result: BacktranslationResult = state["backtranslation_result"]
 
@@ -150,47 +150,47 @@ async def evaluate_node(task=None, **kwargs) -> Dict[str, Any]:
 
         logger.info(f"[{unit.key}] 평가 시작 (3개 에이전트 병렬), 리스크 프로파일: {unit.risk_profile}")
 
-        # 3개 에이전트 병렬 실행
-        results = await asyncio.gather(
-            evaluate_accuracy(
-                source_text=unit.source_text,
-                translation=translation,
-                backtranslation=backtranslation,
-                source_lang=unit.source_lang,
-                target_lang=unit.target_lang,
-                glossary=unit.glossary,
-                key=unit.key
-            ),
-            evaluate_compliance(
-                source_text=unit.source_text,
-                translation=translation,
-                source_lang=unit.source_lang,
-                target_lang=unit.target_lang,
-                risk_profile=risk_profile,
-                content_context="FAQ",
-                key=unit.key
-            ),
-            evaluate_quality(
-                source_text=unit.source_text,
-                translation=translation,
-                source_lang=unit.source_lang,
-                target_lang=unit.target_lang,
-                candidates=candidates if len(candidates) > 1 else None,
-                content_type="FAQ",
-                glossary=unit.glossary,
-                key=unit.key
-            ),
-            return_exceptions=True
-        )
-
-        # 예외 처리
-        agent_results = []
-        agent_names = ["accuracy", "compliance", "quality"]
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"[{unit.key}] {agent_names[i]} 평가 실패: {result}")
-                raise result
-            agent_results.append(result)
+        # 3개 에이전트 병렬 실행 (하나라도 실패하면 나머지는 즉시 취소)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = {
+                    "accuracy": tg.create_task(evaluate_accuracy(
+                        source_text=unit.source_text,
+                        translation=translation,
+                        backtranslation=backtranslation,
+                        source_lang=unit.source_lang,
+                        target_lang=unit.target_lang,
+                        glossary=unit.glossary,
+                        key=unit.key
+                    )),
+                    "compliance": tg.create_task(evaluate_compliance(
+                        source_text=unit.source_text,
+                        translation=translation,
+                        source_lang=unit.source_lang,
+                        target_lang=unit.target_lang,
+                        risk_profile=risk_profile,
+                        content_context="FAQ",
+                        key=unit.key
+                    )),
+                    "quality": tg.create_task(evaluate_quality(
+                        source_text=unit.source_text,
+                        translation=translation,
+                        source_lang=unit.source_lang,
+                        target_lang=unit.target_lang,
+                        candidates=candidates if len(candidates) > 1 else None,
+                        content_type="FAQ",
+                        glossary=unit.glossary,
+                        key=unit.key
+                    )),
+                }
+        except ExceptionGroup as eg:
+            # 예외 처리: 실패한 에이전트를 로깅하고 첫 번째 예외를 그대로 전달
+            for name, t in tasks.items():
+                if not t.cancelled() and t.exception() is not None:
+                    logger.error(f"[{unit.key}] {name} 평가 실패: {t.exception()}")
+            raise eg.exceptions[0]
+
+        agent_results = [t.result() for t in tasks.values()]
 
         state["agent_results"] = agent_results
         state["eval_start_time"] = eval_start_time
@@ -219,7 +219,7 @@ async def decide_node(task=None, **kwargs) -> Dict[str, Any]:
     """
     try:
         state = get_workflow_state()
-        unit: TranslationUnit = state["unit"]
+        unit: TranslationUnit = resolve_unit(state)
         agent_results = state["agent_results"]
         attempt_count = state.get("attempt_count", 1)
         max_regenerations = state.get("max_regenerations", 1)
@@ -286,7 +286,7 @@ async def regenerate_node(task=None, **kwargs) -> Dict[str, Any]:
     """
     try:
         state = get_workflow_state()
-        unit: TranslationUnit = state["unit"]
+        unit: TranslationUnit = resolve_unit(state)
         agent_results = state["agent_results"]
         translation_result: TranslationResult = state["translation_result"]
         attempt_count = state.get("attempt_count", 1)
@@ -336,7 +336,7 @@ async def finalize_node(task=None, **kwargs) -> Dict[str, Any]:
     """
     try:
         state = get_workflow_state()
-        unit: TranslationUnit = state["unit"]
+        unit: TranslationUnit = resolve_unit(state)
         decision: GateDecision = state["gate_decision"]
         translation_result: TranslationResult = state["translation_result"]
 
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResult:
     """번역 결과"""
     translation: str                              # 메인 번역
@@ -18,7 +18,7 @@ class TranslationResult:
     latency_ms: int = 0                           # 응답 시간 (밀리초)
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktranslationResult:
     """역번역 결과"""
     backtranslation: str                          # 역번역 텍스트
@@ -55,13 +55,17 @@ VALID_TRANSITIONS = {
 }
 
 
+# Terminal states (no further transitions); a set for O(1) hashed membership
+TERMINAL_STATES = frozenset({
+    WorkflowState.REJECTED,
+    WorkflowState.PUBLISHED,
+    WorkflowState.FAILED,
+})
+
+
 def is_terminal_state(state: WorkflowState) -> bool:
     """Check if a state is terminal (no further transitions)"""
-    return state in [
-        WorkflowState.REJECTED,
-        WorkflowState.PUBLISHED,
-        WorkflowState.FAILED
-    ]
+    return state in TERMINAL_STATES
 
 
 def can_transition(from_state: WorkflowState, to_state: WorkflowState) -> bool:
@@ -11,7 +11,6 @@ import json
 import re
 import time
 import logging
-from textwrap import dedent
 from typing import Dict, Optional, Any
 
 from src.models.agent_result import AgentResult, Correction
@@ -24,6 +23,42 @@ logger = logging.getLogger(__name__)
 CYAN = '\033[96m'
 RESET = '\033[0m'
 
+# 응답 JSON 추출용 정규식
+_JSON_FENCE_RE = re.compile(r'```json\s*([\s\S]*?)\s*```')
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+# 디버그 프롬프트 로그 포맷 (%-style: DEBUG 비활성 시 포맷팅 생략)
+_PROMPT_LOG_FORMAT = (
+    f"\n{CYAN}{'=' * 60}\n"
+    "[Accuracy]%s %s\n"
+    f"{'=' * 60}{RESET}\n"
+    "%s\n"
+    f"{CYAN}{'=' * 60}{RESET}"
+)
+
+# 사용자 메시지 템플릿 (모듈 로드 시 1회 구성)
+_USER_MSG_TEMPLATE = (
+    "다음 번역을 정확성 관점에서 평가하세요.\n"
+    "\n"
+    "<source_text>\n"
+    "{source_text}\n"
+    "</source_text>\n"
+    "\n"
+    "<translation>\n"
+    "{translation}\n"
+    "</translation>\n"
+    "\n"
+    "<backtranslation>\n"
+    "{backtranslation}\n"
+    "</backtranslation>\n"
+    "\n"
+    "<glossary>\n"
+    "{glossary}\n"
+    "</glossary>\n"
+    "\n"
+    "위 내용을 바탕으로 정확성을 평가하고 결과를 JSON 형식으로 반환하세요."
+)
+
 
 async def evaluate_accuracy(
     source_text: str,
@@ -72,15 +107,8 @@ async def evaluate_accuracy(
     # 시스템 프롬프트 로드
     system_prompt = _build_system_prompt(source_lang, target_lang)
 
-    if logger.isEnabledFor(logging.DEBUG):
-        key_label = f" ({key})" if key else ""
-        logger.debug(
-            f"\n{CYAN}{'='*60}\n"
-            f"[Accuracy]{key_label} SYSTEM PROMPT\n"
-            f"{'='*60}{RESET}\n"
-            f"{system_prompt}\n"
-            f"{CYAN}{'='*60}{RESET}"
-        )
+    key_label = f" ({key})" if key else ""
+    logger.debug(_PROMPT_LOG_FORMAT, key_label, "SYSTEM PROMPT", system_prompt)
 
     # 에이전트 생성
     agent = get_agent(
@@ -98,15 +126,7 @@ async def evaluate_accuracy(
         glossary=glossary
     )
 
-    if logger.isEnabledFor(logging.DEBUG):
-        key_label = f" ({key})" if key else ""
-        logger.debug(
-            f"\n{CYAN}{'='*60}\n"
-            f"[Accuracy]{key_label} USER PROMPT\n"
-            f"{'='*60}{RESET}\n"
-            f"{user_message}\n"
-            f"{CYAN}{'='*60}{RESET}"
-        )
+    logger.debug(_PROMPT_LOG_FORMAT, key_label, "USER PROMPT", user_message)
 
     # 에이전트 비동기 실행
     try:
@@ -158,38 +178,27 @@ def _build_user_message(
     else:
         glossary_text = "(용어집 없음)"
 
-    return dedent(f"""\
-        다음 번역을 정확성 관점에서 평가하세요.
-
-        <source_text>
-        {source_text}
-        </source_text>
-
-        <translation>
-        {translation}
-        </translation>
-
-        <backtranslation>
-        {backtranslation}
-        </backtranslation>
-
-        <glossary>
-        {glossary_text}
-        </glossary>
-
-        위 내용을 바탕으로 정확성을 평가하고 결과를 JSON 형식으로 반환하세요.\
-    """)
+    return _USER_MSG_TEMPLATE.format(
+        source_text=source_text,
+        translation=translation,
+        backtranslation=backtranslation,
+        glossary=glossary_text
+    )
 
 
 def _parse_evaluation_response(response_text: str) -> Dict[str, Any]:
     """에이전트 응답 파싱"""
 
-    # JSON 블록 추출
-    json_match = re.search(r'```json\s*([\s\S]*?)\s*```', response_text)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        json_match = re.search(r'\{[\s\S]*\}', response_text)
+    # JSON 블록 추출 (펜스가 있을 때만 정규식 실행)
+    json_str = None
+    fence_idx = response_text.find("```json")
+    if fence_idx >= 0:
+        json_match = _JSON_FENCE_RE.search(response_text, fence_idx)
+        if json_match:
+            json_str = json_match.group(1)
+    if json_str is None:
+        # JSON 블록이 없으면 전체에서 JSON 찾기
+        json_match = _JSON_OBJECT_RE.search(response_text)
         json_str = json_match.group() if json_match else None
 
     if json_str:
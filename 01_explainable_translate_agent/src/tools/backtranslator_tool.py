@@ -11,7 +11,6 @@ import json
 import re
 import time
 import logging
-from textwrap import dedent
 from typing import Dict, Optional, Any
 
 from src.models import BacktranslationResult
@@ -24,6 +23,28 @@ logger = logging.getLogger(__name__)
 MAGENTA = '\033[95m'
 RESET = '\033[0m'
 
+# 응답 JSON 추출용 정규식
+_JSON_FENCE_RE = re.compile(r'```json\s*([\s\S]*?)\s*```')
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+# 디버그 프롬프트 로그 포맷 (%-style: DEBUG 비활성 시 포맷팅 생략)
+_PROMPT_LOG_FORMAT = (
+    f"\n{MAGENTA}{'=' * 60}\n"
+    "[Backtranslator]%s %s\n"
+    f"{'=' * 60}{RESET}\n"
+    "%s\n"
+    f"{MAGENTA}{'=' * 60}{RESET}"
+)
+
+# 사용자 메시지 템플릿 (모듈 로드 시 1회 구성)
+_USER_MSG_TEMPLATE = (
+    "<source_text>\n"
+    "{text}\n"
+    "</source_text>\n"
+    "\n"
+    "위 텍스트를 {target_lang}로 역번역하세요. 가능한 한 직역하여 원래 의미를 드러내세요."
+)
+
 
 async def backtranslate(
     text: str,
@@ -65,15 +86,8 @@ async def backtranslate(
     # 시스템 프롬프트 로드
     system_prompt = _build_system_prompt(source_lang, target_lang)
 
-    if logger.isEnabledFor(logging.DEBUG):
-        key_label = f" ({key})" if key else ""
-        logger.debug(
-            f"\n{MAGENTA}{'='*60}\n"
-            f"[Backtranslator]{key_label} SYSTEM PROMPT\n"
-            f"{'='*60}{RESET}\n"
-            f"{system_prompt}\n"
-            f"{MAGENTA}{'='*60}{RESET}"
-        )
+    key_label = f" ({key})" if key else ""
+    logger.debug(_PROMPT_LOG_FORMAT, key_label, "SYSTEM PROMPT", system_prompt)
 
     # 에이전트 생성 (프롬프트 캐싱 포함)
     agent = get_agent(
@@ -84,23 +98,9 @@ async def backtranslate(
     )
 
     # 사용자 메시지 구성
-    user_message = dedent(f"""\
-        <source_text>
-        {text}
-        </source_text>
-
-        위 텍스트를 {target_lang}로 역번역하세요. 가능한 한 직역하여 원래 의미를 드러내세요.\
-    """)
-
-    if logger.isEnabledFor(logging.DEBUG):
-        key_label = f" ({key})" if key else ""
-        logger.debug(
-            f"\n{MAGENTA}{'='*60}\n"
-            f"[Backtranslator]{key_label} USER PROMPT\n"
-            f"{'='*60}{RESET}\n"
-            f"{user_message}\n"
-            f"{MAGENTA}{'='*60}{RESET}"
-        )
+    user_message = _USER_MSG_TEMPLATE.format(text=text, target_lang=target_lang)
+
+    logger.debug(_PROMPT_LOG_FORMAT, key_label, "USER PROMPT", user_message)
 
     # 에이전트 비동기 실행
     try:
@@ -140,12 +140,16 @@ def _parse_backtranslation_response(response_text: str) -> Dict[str, Any]:
 
     JSON 블록을 추출하고 역번역 결과를 반환합니다.
     """
-    # JSON 블록 추출
-    json_match = re.search(r'```json\s*([\s\S]*?)\s*```', response_text)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        json_match = re.search(r'\{[\s\S]*\}', response_text)
+    # JSON 블록 추출 (펜스가 있을 때만 정규식 실행)
+    json_str = None
+    fence_idx = response_text.find("```json")
+    if fence_idx >= 0:
+        json_match = _JSON_FENCE_RE.search(response_text, fence_idx)
+        if json_match:
+            json_str = json_match.group(1)
+    if json_str is None:
+        # JSON 블록이 없으면 전체에서 JSON 찾기
+        json_match = _JSON_OBJECT_RE.search(response_text)
         json_str = json_match.group() if json_match else None
 
     if json_str:
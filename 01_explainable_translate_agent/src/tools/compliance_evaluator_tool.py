@@ -11,7 +11,6 @@ import json
 import re
 import time
 import logging
-from textwrap import dedent
 from typing import Dict, Optional, Any
 
 from src.models.agent_result import AgentResult, Correction
@@ -24,6 +23,48 @@ logger = logging.getLogger(__name__)
 YELLOW = '\033[93m'
 RESET = '\033[0m'
 
+# 응답 JSON 추출용 정규식
+_JSON_FENCE_RE = re.compile(r'```json\s*([\s\S]*?)\s*```')
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+# 디버그 프롬프트 로그 포맷 (%-style: DEBUG 비활성 시 포맷팅 생략)
+_PROMPT_LOG_FORMAT = (
+    f"\n{YELLOW}{'=' * 60}\n"
+    "[Compliance]%s %s\n"
+    f"{'=' * 60}{RESET}\n"
+    "%s\n"
+    f"{YELLOW}{'=' * 60}{RESET}"
+)
+
+# 시스템 프롬프트 risk_profile 섹션 템플릿
+_RISK_SECTION_TEMPLATE = (
+    "\n"
+    "## Risk Profile\n"
+    "<risk_profile>\n"
+    "{risk_text}\n"
+    "</risk_profile>\n"
+    "\n"
+    "## Content Context\n"
+    "<content_context>\n"
+    "{content_context}\n"
+    "</content_context>\n"
+)
+
+# 사용자 메시지 템플릿 (모듈 로드 시 1회 구성)
+_USER_MSG_TEMPLATE = (
+    "다음 번역을 규정 준수 관점에서 평가하세요.\n"
+    "\n"
+    "<source_text>\n"
+    "{source_text}\n"
+    "</source_text>\n"
+    "\n"
+    "<translation>\n"
+    "{translation}\n"
+    "</translation>\n"
+    "\n"
+    "위 내용을 바탕으로 규정 준수를 평가하고 결과를 JSON 형식으로 반환하세요."
+)
+
 
 async def evaluate_compliance(
     source_text: str,
@@ -78,15 +119,8 @@ async def evaluate_compliance(
         content_context=content_context
     )
 
-    if logger.isEnabledFor(logging.DEBUG):
-        key_label = f" ({key})" if key else ""
-        logger.debug(
-            f"\n{YELLOW}{'='*60}\n"
-            f"[Compliance]{key_label} SYSTEM PROMPT (with risk_profile - cached)\n"
-            f"{'='*60}{RESET}\n"
-            f"{system_prompt}\n"
-            f"{YELLOW}{'='*60}{RESET}"
-        )
+    key_label = f" ({key})" if key else ""
+    logger.debug(_PROMPT_LOG_FORMAT, key_label, "SYSTEM PROMPT (with risk_profile - cached)", system_prompt)
 
     # 에이전트 생성
     agent = get_agent(
@@ -102,15 +136,7 @@ async def evaluate_compliance(
         translation=translation
     )
 
-    if logger.isEnabledFor(logging.DEBUG):
-        key_label = f" ({key})" if key else ""
-        logger.debug(
-            f"\n{YELLOW}{'='*60}\n"
-            f"[Compliance]{key_label} USER PROMPT\n"
-            f"{'='*60}{RESET}\n"
-            f"{user_message}\n"
-            f"{YELLOW}{'='*60}{RESET}"
-        )
+    logger.debug(_PROMPT_LOG_FORMAT, key_label, "USER PROMPT", user_message)
 
     # 에이전트 비동기 실행
     try:
@@ -164,17 +190,10 @@ def _build_system_prompt(
     else:
         risk_text = "(기본 리스크 프로파일 - 금칙어 없음)"
 
-    risk_section = dedent(f"""
-## Risk Profile
-<risk_profile>
-{risk_text}
-</risk_profile>
-
-## Content Context
-<content_context>
-{content_context}
-</content_context>
-""")
+    risk_section = _RISK_SECTION_TEMPLATE.format(
+        risk_text=risk_text,
+        content_context=content_context
+    )
 
     return base_prompt + "\n" + risk_section
 
@@ -189,29 +208,24 @@ def _build_user_message(
     risk_profile은 시스템 프롬프트로 이동하여 캐싱 최적화.
     사용자 메시지는 매번 변경되는 번역 내용만 포함.
     """
-    return dedent(f"""\
-        다음 번역을 규정 준수 관점에서 평가하세요.
-
-        <source_text>
-        {source_text}
-        </source_text>
-
-        <translation>
-        {translation}
-        </translation>
-
-        위 내용을 바탕으로 규정 준수를 평가하고 결과를 JSON 형식으로 반환하세요.\
-    """)
+    return _USER_MSG_TEMPLATE.format(
+        source_text=source_text,
+        translation=translation
+    )
 
 
 def _parse_evaluation_response(response_text: str) -> Dict[str, Any]:
     """에이전트 응답 파싱"""
-    # JSON 블록 추출
-    json_match = re.search(r'```json\s*([\s\S]*?)\s*```', response_text)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        json_match = re.search(r'\{[\s\S]*\}', response_text)
+    # JSON 블록 추출 (펜스가 있을 때만 정규식 실행)
+    json_str = None
+    fence_idx = response_text.find("```json")
+    if fence_idx >= 0:
+        json_match = _JSON_FENCE_RE.search(response_text, fence_idx)
+        if json_match:
+            json_str = json_match.group(1)
+    if json_str is None:
+        # JSON 블록이 없으면 전체에서 JSON 찾기
+        json_match = _JSON_OBJECT_RE.search(response_text)
         json_str = json_match.group() if json_match else None
 
     if json_str:
@@ -12,7 +12,6 @@ import json
 import re
 import time
 import logging
-from textwrap import dedent
 from typing import Dict, List, Optional, Any
 
 from src.models.agent_result import AgentResult, Correction
@@ -25,6 +24,37 @@ logger = logging.getLogger(__name__)
 GREEN = '\033[92m'
 RESET = '\033[0m'
 
+# 응답 JSON 추출용 정규식
+_JSON_FENCE_RE = re.compile(r'```json\s*([\s\S]*?)\s*```')
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+# 디버그 프롬프트 로그 포맷 (%-style: DEBUG 비활성 시 포맷팅 생략)
+_PROMPT_LOG_FORMAT = (
+    f"\n{GREEN}{'=' * 60}\n"
+    "[Quality]%s %s\n"
+    f"{'=' * 60}{RESET}\n"
+    "%s\n"
+    f"{GREEN}{'=' * 60}{RESET}"
+)
+
+# 사용자 메시지 템플릿 (모듈 로드 시 1회 구성)
+_USER_MSG_TEMPLATE = (
+    "다음 번역을 품질 관점에서 평가하세요.\n"
+    "\n"
+    "<source_text>\n"
+    "{source_text}\n"
+    "</source_text>\n"
+    "\n"
+    "<translation>\n"
+    "{translation}\n"
+    "</translation>{candidates_section}{glossary_section}\n"
+    "<content_type>\n"
+    "{content_type}\n"
+    "</content_type>\n"
+    "\n"
+    "위 내용을 바탕으로 품질을 평가하고 결과를 JSON 형식으로 반환하세요."
+)
+
 
 async def evaluate_quality(
     source_text: str,
@@ -90,15 +120,8 @@ async def evaluate_quality(
         locale_guidelines=locale_guidelines
     )
 
-    if logger.isEnabledFor(logging.DEBUG):
-        key_label = f" ({key})" if key else ""
-        logger.debug(
-            f"\n{GREEN}{'='*60}\n"
-            f"[Quality]{key_label} SYSTEM PROMPT\n"
-            f"{'='*60}{RESET}\n"
-            f"{system_prompt}\n"
-            f"{GREEN}{'='*60}{RESET}"
-        )
+    key_label = f" ({key})" if key else ""
+    logger.debug(_PROMPT_LOG_FORMAT, key_label, "SYSTEM PROMPT", system_prompt)
 
     # 에이전트 생성
     agent = get_agent(
@@ -117,15 +140,7 @@ async def evaluate_quality(
         glossary=glossary
     )
 
-    if logger.isEnabledFor(logging.DEBUG):
-        key_label = f" ({key})" if key else ""
-        logger.debug(
-            f"\n{GREEN}{'='*60}\n"
-            f"[Quality]{key_label} USER PROMPT\n"
-            f"{'='*60}{RESET}\n"
-            f"{user_message}\n"
-            f"{GREEN}{'='*60}{RESET}"
-        )
+    logger.debug(_PROMPT_LOG_FORMAT, key_label, "USER PROMPT", user_message)
 
     # 에이전트 비동기 실행
     try:
@@ -183,53 +198,36 @@ def _build_user_message(
     candidates_section = ""
     if candidates and len(candidates) > 1:
         candidate_lines = [f"후보 {i}: {c}" for i, c in enumerate(candidates)]
-        candidates_text = "\n".join(candidate_lines)
-        candidates_section = dedent(f"""\
-
-            <candidates>
-            {candidates_text}
-            </candidates>
-        """)
+        candidates_section = "\n<candidates>\n" + "\n".join(candidate_lines) + "\n</candidates>\n"
 
     # 용어집 섹션 구성
     glossary_section = ""
     if glossary:
         glossary_lines = [f"  {k} → {v}" for k, v in glossary.items()]
-        glossary_text = "\n".join(glossary_lines)
-        glossary_section = dedent(f"""\
-
-            <glossary>
-            {glossary_text}
-            </glossary>
-        """)
-
-    return dedent(f"""\
-        다음 번역을 품질 관점에서 평가하세요.
+        glossary_section = "\n<glossary>\n" + "\n".join(glossary_lines) + "\n</glossary>\n"
 
-        <source_text>
-        {source_text}
-        </source_text>
-
-        <translation>
-        {translation}
-        </translation>{candidates_section}{glossary_section}
-        <content_type>
-        {content_type}
-        </content_type>
-
-        위 내용을 바탕으로 품질을 평가하고 결과를 JSON 형식으로 반환하세요.\
-    """)
+    return _USER_MSG_TEMPLATE.format(
+        source_text=source_text,
+        translation=translation,
+        candidates_section=candidates_section,
+        glossary_section=glossary_section,
+        content_type=content_type
+    )
 
 
 def _parse_evaluation_response(response_text: str) -> Dict[str, Any]:
     """에이전트 응답 파싱"""
 
-    # JSON 블록 추출
-    json_match = re.search(r'```json\s*([\s\S]*?)\s*```', response_text)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        json_match = re.search(r'\{[\s\S]*\}', response_text)
+    # JSON 블록 추출 (펜스가 있을 때만 정규식 실행)
+    json_str = None
+    fence_idx = response_text.find("```json")
+    if fence_idx >= 0:
+        json_match = _JSON_FENCE_RE.search(response_text, fence_idx)
+        if json_match:
+            json_str = json_match.group(1)
+    if json_str is None:
+        # JSON 블록이 없으면 전체에서 JSON 찾기
+        json_match = _JSON_OBJECT_RE.search(response_text)
         json_str = json_match.group() if json_match else None
 
     if json_str:
@@ -21,6 +21,29 @@ logger = logging.getLogger(__name__)
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
+# 응답 JSON 추출용 정규식
+_JSON_FENCE_RE = re.compile(r'```json\s*([\s\S]*?)\s*```')
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+# 디버그 프롬프트 로그 포맷 (%-style: DEBUG 비활성 시 포맷팅 생략)
+_PROMPT_LOG_FORMAT = (
+    f"\n{BLUE}{'=' * 60}\n"
+    "[Translator]%s %s\n"
+    f"{'=' * 60}{RESET}\n"
+    "%s\n"
+    f"{BLUE}{'=' * 60}{RESET}"
+)
+
+# 후보 수 지시 템플릿 (모듈 로드 시 1회 구성)
+_CANDIDATES_INSTRUCTION_TEMPLATE = (
+    "\n"
+    "\n"
+    "<instruction>\n"
+    "{num_candidates}개의 번역 후보를 생성하세요.\n"
+    "candidates 배열에 모든 후보를 포함하세요.\n"
+    "</instruction>"
+)
+
 
 async def translate(
     source_text: str,
@@ -86,15 +109,8 @@ async def translate(
         num_candidates=num_candidates
     )
 
-    if logger.isEnabledFor(logging.DEBUG):
-        key_label = f" ({key})" if key else ""
-        logger.debug(
-            f"\n{BLUE}{'='*60}\n"
-            f"[Translator]{key_label} USER PROMPT\n"
-            f"{'='*60}{RESET}\n"
-            f"{user_message}\n"
-            f"{BLUE}{'='*60}{RESET}"
-        )
+    key_label = f" ({key})" if key else ""
+    logger.debug(_PROMPT_LOG_FORMAT, key_label, "USER PROMPT", user_message)
 
     # 에이전트 비동기 실행
     try:
@@ -153,15 +169,8 @@ def _build_system_prompt(
         style_guide=style_text
     )
 
-    if logger.isEnabledFor(logging.DEBUG):
-        key_label = f" ({key})" if key else ""
-        logger.debug(
-            f"\n{BLUE}{'='*60}\n"
-            f"[Translator]{key_label} SYSTEM PROMPT\n"
-            f"{'='*60}{RESET}\n"
-            f"{prompt}\n"
-            f"{BLUE}{'='*60}{RESET}"
-        )
+    key_label = f" ({key})" if key else ""
+    logger.debug(_PROMPT_LOG_FORMAT, key_label, "SYSTEM PROMPT", prompt)
 
     return prompt
 
@@ -172,38 +181,37 @@ def _build_user_message(
     num_candidates: int = 1
 ) -> str:
     """사용자 메시지 구성"""
-    parts = []
-
-    # 피드백이 있으면 추가 (Maker-Checker 루프)
-    if feedback:
-        parts.append(feedback)
-        parts.append("")
-
-    # 원문
-    parts.append("<source_text>")
-    parts.append(source_text)
-    parts.append("</source_text>")
+    # 피드백이 있으면 앞에 추가 (Maker-Checker 루프)
+    feedback_section = f"{feedback}\n\n" if feedback else ""
 
     # 후보 수 지시
+    instruction_section = ""
     if num_candidates > 1:
-        parts.append("")
-        parts.append(f"<instruction>")
-        parts.append(f"{num_candidates}개의 번역 후보를 생성하세요.")
-        parts.append(f"candidates 배열에 모든 후보를 포함하세요.")
-        parts.append(f"</instruction>")
+        instruction_section = _CANDIDATES_INSTRUCTION_TEMPLATE.format(
+            num_candidates=num_candidates
+        )
 
-    return "\n".join(parts)
+    return "".join((
+        feedback_section,
+        "<source_text>\n",
+        source_text,
+        "\n</source_text>",
+        instruction_section,
+    ))
 
 
 def _parse_translation_response(response_text: str) -> Dict[str, Any]:
     """에이전트 응답 파싱 - JSON 블록 추출"""
-    # JSON 블록 추출
-    json_match = re.search(r'```json\s*([\s\S]*?)\s*```', response_text)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
+    # JSON 블록 추출 (펜스가 있을 때만 정규식 실행)
+    json_str = None
+    fence_idx = response_text.find("```json")
+    if fence_idx >= 0:
+        json_match = _JSON_FENCE_RE.search(response_text, fence_idx)
+        if json_match:
+            json_str = json_match.group(1)
+    if json_str is None:
         # JSON 블록이 없으면 전체에서 JSON 찾기
-        json_match = re.search(r'\{[\s\S]*\}', response_text)
+        json_match = _JSON_OBJECT_RE.search(response_text)
         json_str = json_match.group() if json_match else None
 
     if json_str:
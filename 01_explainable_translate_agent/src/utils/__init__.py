@@ -37,6 +37,7 @@ from .observability import (
     get_session_id,
     # Tracer
     get_tracer,
+    is_tracing_enabled,
     # Span Helpers
     add_span_event,
     set_span_attribute,
@@ -60,6 +61,7 @@ from .config import (
     get_thresholds,
     get_risk_profile,
     get_glossary,
+    read_yaml,
 )
 
 # Workflow State Management for GraphBuilder
@@ -69,6 +71,8 @@ from .workflow_state import (
     get_state_manager,
     get_workflow_state,
     update_workflow_state,
+    workflow_elapsed_ms,
+    resolve_unit,
     workflow_context,
     should_regenerate_from_state,
     should_finalize_from_state,
@@ -119,6 +123,7 @@ __all__ = [
     "set_session_context",
     "get_session_id",
     "get_tracer",
+    "is_tracing_enabled",
     "add_span_event",
     "set_span_attribute",
     "set_span_status",
@@ -135,12 +140,15 @@ __all__ = [
     "get_thresholds",
     "get_risk_profile",
     "get_glossary",
+    "read_yaml",
     # Workflow State Management
     "WorkflowConfig",
     "WorkflowStateManager",
     "get_state_manager",
     "get_workflow_state",
     "update_workflow_state",
+    "workflow_elapsed_ms",
+    "resolve_unit",
     "workflow_context",
     "should_regenerate_from_state",
     "should_finalize_from_state",
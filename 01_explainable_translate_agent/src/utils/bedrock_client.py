@@ -18,13 +18,36 @@ Migration:
 
 import boto3
 import time
+import threading
 import yaml
 import os
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
+from botocore.config import Config as BotoConfig
 
 
-@dataclass
+# Shared bedrock-runtime clients keyed by region.
+# boto3 clients are thread-safe; reusing one keeps its connection pool and
+# resolved credentials warm across BedrockClient instances.
+_CLIENTS: Dict[str, Any] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_shared_client(region: str) -> Any:
+    """Get or create the shared bedrock-runtime client for a region"""
+    with _CLIENT_LOCK:
+        client = _CLIENTS.get(region)
+        if client is None:
+            client = boto3.session.Session().client(
+                service_name="bedrock-runtime",
+                region_name=region,
+                config=BotoConfig(tcp_keepalive=True)
+            )
+            _CLIENTS[region] = client
+        return client
+
+
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     """Configuration for a specific model role"""
     model_id: str
@@ -63,12 +86,9 @@ class BedrockClient:
         if region_name:
             self.region = region_name
 
-        # Initialize boto3 client
+        # Reuse the shared boto3 client for this region
         try:
-            self.client = boto3.client(
-                service_name="bedrock-runtime",
-                region_name=self.region
-            )
+            self.client = _get_shared_client(self.region)
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Bedrock client: {e}")
 
@@ -3,11 +3,76 @@ Configuration Loader - Load YAML configuration files
 """
 
 import os
+import copy
+import hashlib
+import json
+import logging
+import tempfile
+import threading
+import time
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple, FrozenSet, Mapping
 from functools import lru_cache
 
+# Prefer the libyaml C binding (much faster than the pure-Python parser)
+try:
+    from yaml import CSafeLoader as _SafeLoader
+    _LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+    _LIBYAML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Whether the pure-Python fallback still needs to be reported (once, on first parse)
+_report_libyaml_fallback = not _LIBYAML_AVAILABLE
+
+# Shared read-only empty result for glossary/style guide lookups
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Default config directory: 01_explainable_translate_agent/config/
+_DEFAULT_CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
+
+# Recognized YAML file extensions
+_YAML_SUFFIXES = (".yaml", ".yml")
+
+# Seconds between automatic tree-mtime checks of a data index during lookups
+_DATA_INDEX_RECHECK_S = 2.0
+
+
+def read_yaml(path) -> Any:
+    """
+    Read and parse a YAML file with the libyaml CSafeLoader when available.
+
+    Shared by ConfigLoader and strands_utils.load_config. Reads the whole file as bytes and hands libyaml a str, skipping the
+    TextIOWrapper and PyYAML's chunked stream reads.
+    """
+    global _report_libyaml_fallback
+    if _report_libyaml_fallback:
+        _report_libyaml_fallback = False
+        logger.debug(
+            "PyYAML was built without libyaml; parsing config with the "
+            "pure-Python SafeLoader"
+        )
+    return yaml.load(Path(path).read_bytes().decode("utf-8"), Loader=_SafeLoader)
+
+
+def _max_mtime_ns(directory: Path) -> int:
+    """Latest st_mtime_ns of a directory and everything below it (0 if missing)"""
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    mtime_ns = max(mtime_ns, _max_mtime_ns(entry.path))
+                else:
+                    mtime_ns = max(mtime_ns, entry.stat().st_mtime_ns)
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+    return mtime_ns
+
 
 class ConfigLoader:
     """
@@ -28,12 +93,24 @@ class ConfigLoader:
                         Defaults to config/ at project root.
         """
         if config_dir is None:
-            # Default: 01_explainable_translate_agent/config/
-            base_dir = Path(__file__).parent.parent.parent
-            self.config_dir = base_dir / "config"
+            self.config_dir = _DEFAULT_CONFIG_DIR
         else:
             self.config_dir = Path(config_dir)
 
+        # Data file cache: path -> (st_mtime_ns, parsed data)
+        self._file_cache: Dict[str, Tuple[int, Any]] = {}
+        # Directory listing cache: dir path -> (st_mtime_ns, entry names)
+        self._dir_cache: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+        # Max st_mtime_ns under config_dir as of the first load()
+        self._config_mtime_ns: Optional[int] = None
+        # Optional on-disk cache of parsed YAML (JSON sidecars)
+        self._cache_dir: Optional[str] = os.getenv("CONFIG_CACHE_DIR") or None
+        # Per-kind data index ("glossaries", "style_guides"):
+        # kind -> (max st_mtime_ns over the tree, {(product, lang): data})
+        self._data_index: Dict[str, Tuple[int, Dict[Tuple[str, str], Mapping[str, Any]]]] = {}
+        # kind -> time.monotonic() after which the next lookup re-checks the tree mtime
+        self._data_index_recheck_at: Dict[str, float] = {}
+
     @lru_cache(maxsize=32)
     def load(self, name: str) -> Dict[str, Any]:
         """
@@ -48,16 +125,13 @@ class ConfigLoader:
         Raises:
             FileNotFoundError: If config file not found
         """
-        candidates = [
-            self.config_dir / f"{name}.yaml",
-            self.config_dir / f"{name}.yml",
-            self.config_dir / name,
-        ]
+        if self._config_mtime_ns is None:
+            # Baseline for reload_if_changed()
+            self._config_mtime_ns = _max_mtime_ns(self.config_dir)
 
-        for path in candidates:
-            if path.exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    return yaml.safe_load(f)
+        path = self._resolve(self.config_dir, [f"{name}.yaml", f"{name}.yml", name])
+        if path is not None:
+            return self._parse_yaml(path)
 
         raise FileNotFoundError(
             f"Config file '{name}' not found in {self.config_dir}"
@@ -76,16 +150,13 @@ class ConfigLoader:
         # risk_profiles are in data/ (not config/) - they're knowledge, not settings
         data_dir = self.config_dir.parent / "data"
         profile_dir = data_dir / "risk_profiles"
-        candidates = [
-            profile_dir / f"{country_code}.yaml",
-            profile_dir / f"{country_code}.yml",
-            profile_dir / "DEFAULT.yaml",
-        ]
-
-        for path in candidates:
-            if path.exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    return yaml.safe_load(f)
+        path = self._resolve(
+            profile_dir,
+            [f"{country_code}.yaml", f"{country_code}.yml", "DEFAULT.yaml"]
+        )
+        if path is not None:
+            # Deep copy so callers cannot mutate the cached profile
+            return copy.deepcopy(self._load_yaml_file(path))
 
         # Return minimal default if no profile found
         return {
@@ -101,22 +172,24 @@ class ConfigLoader:
         """List available risk profile country codes"""
         data_dir = self.config_dir.parent / "data"
         profile_dir = data_dir / "risk_profiles"
-        if not profile_dir.exists():
+        try:
+            with os.scandir(profile_dir) as it:
+                profiles = {
+                    entry.name.rsplit(".", 1)[0]
+                    for entry in it
+                    if entry.name.endswith(_YAML_SUFFIXES)
+                    and entry.is_file(follow_symlinks=False)
+                }
+        except (FileNotFoundError, NotADirectoryError):
             return []
 
-        profiles = []
-        for path in profile_dir.glob("*.yaml"):
-            profiles.append(path.stem)
-        for path in profile_dir.glob("*.yml"):
-            profiles.append(path.stem)
-
-        return sorted(set(profiles))
+        return sorted(profiles)
 
     def load_glossary(
         self,
         product: str,
         target_lang: str
-    ) -> Dict[str, str]:
+    ) -> Mapping[str, str]:
         """
         Load a product-specific glossary for a target language.
 
@@ -125,38 +198,15 @@ class ConfigLoader:
             target_lang: Target language code (e.g., "en", "en-rUS", "ja")
 
         Returns:
-            Glossary dict mapping source terms to target terms
+            Read-only mapping of source terms to target terms (shared; copy to modify)
         """
-        data_dir = self.config_dir.parent / "data"
-        glossary_dir = data_dir / "glossaries" / product
-
-        # Normalize language code: "en-rUS" → "en"
-        base_lang = target_lang.split("-")[0]
-
-        candidates = [
-            glossary_dir / f"{target_lang}.yaml",  # exact match (en-rUS.yaml)
-            glossary_dir / f"{target_lang}.yml",
-            glossary_dir / f"{base_lang}.yaml",    # base language (en.yaml)
-            glossary_dir / f"{base_lang}.yml",
-        ]
-
-        for path in candidates:
-            if path.exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                    # Filter out comments (keys starting with #)
-                    if data:
-                        return {k: v for k, v in data.items() if not k.startswith("#")}
-                    return {}
-
-        # Return empty glossary if not found
-        return {}
+        return self._lookup_indexed("glossaries", product, target_lang)
 
     def load_style_guide(
         self,
         product: str,
         target_lang: str
-    ) -> Dict[str, str]:
+    ) -> Mapping[str, str]:
         """
         Load a product-specific style guide for a target language.
 
@@ -165,55 +215,31 @@ class ConfigLoader:
             target_lang: Target language code (e.g., "en", "en-rUS", "ja")
 
         Returns:
-            Style guide dict (e.g., {"tone": "formal", "voice": "active"})
+            Read-only style guide mapping (e.g., {"tone": "formal", "voice": "active"})
         """
-        data_dir = self.config_dir.parent / "data"
-        style_dir = data_dir / "style_guides" / product
-
-        # Normalize language code: "en-rUS" → "en"
-        base_lang = target_lang.split("-")[0]
-
-        candidates = [
-            style_dir / f"{target_lang}.yaml",  # exact match (en-rUS.yaml)
-            style_dir / f"{target_lang}.yml",
-            style_dir / f"{base_lang}.yaml",    # base language (en.yaml)
-            style_dir / f"{base_lang}.yml",
-        ]
-
-        for path in candidates:
-            if path.exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                    if data:
-                        return {k: v for k, v in data.items() if not k.startswith("#")}
-                    return {}
-
-        # Return empty style guide if not found
-        return {}
+        return self._lookup_indexed("style_guides", product, target_lang)
 
     def list_glossaries(self) -> List[Dict[str, Any]]:
         """List available glossaries with their products and languages"""
         data_dir = self.config_dir.parent / "data"
         glossary_base = data_dir / "glossaries"
-        if not glossary_base.exists():
+        try:
+            with os.scandir(glossary_base) as it:
+                product_dirs = [entry for entry in it if entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
             return []
 
         glossaries = []
-        for product_dir in glossary_base.iterdir():
-            if product_dir.is_dir():
-                product = product_dir.name
-                for path in product_dir.glob("*.yaml"):
-                    glossaries.append({
-                        "product": product,
-                        "language": path.stem,
-                        "path": str(path)
-                    })
-                for path in product_dir.glob("*.yml"):
-                    glossaries.append({
-                        "product": product,
-                        "language": path.stem,
-                        "path": str(path)
-                    })
+        for product_dir in product_dirs:
+            with os.scandir(product_dir.path) as it:
+                for entry in it:
+                    if (entry.name.endswith(_YAML_SUFFIXES)
+                            and entry.is_file(follow_symlinks=False)):
+                        glossaries.append({
+                            "product": product_dir.name,
+                            "language": entry.name.rsplit(".", 1)[0],
+                            "path": entry.path
+                        })
 
         return glossaries
 
@@ -239,42 +265,290 @@ class ConfigLoader:
             raise ValueError(f"Unknown model role: {role}")
         return models[role]
 
+    def _resolve(self, directory: Path, names: List[str]) -> Optional[Path]:
+        """
+        Return the first of `names` present in `directory`, or None.
+
+        Lists the directory once with os.scandir and reuses that listing
+        until the directory's mtime changes, instead of probing each
+        candidate with Path.exists().
+        """
+        key = str(directory)
+        try:
+            dir_mtime_ns = os.stat(key).st_mtime_ns
+            cached = self._dir_cache.get(key)
+            if cached is None or cached[0] != dir_mtime_ns:
+                with os.scandir(key) as it:
+                    cached = (dir_mtime_ns, frozenset(entry.name for entry in it))
+                self._dir_cache[key] = cached
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+        entries = cached[1]
+        for name in names:
+            if name in entries:
+                return directory / name
+        return None
+
+    def _lookup_indexed(
+        self,
+        kind: str,
+        product: str,
+        target_lang: str
+    ) -> Mapping[str, Any]:
+        """
+        Look up data/<kind>/<product>/<lang> in the aggregated index.
+
+        Tries the exact language first ("en-rUS"), then the base
+        language ("en"). The index is built on first use. Lookups are a
+        dict hit; at most every _DATA_INDEX_RECHECK_S seconds one lookup
+        also compares the max mtime over data/<kind>/ and rebuilds the
+        index if it changed, so edited files are picked up without a
+        manual reload (reload_if_changed() forces the check immediately).
+        Entries are shared read-only mappings with comment keys removed.
+        """
+        cached = self._data_index.get(kind)
+        if cached is None or time.monotonic() >= self._data_index_recheck_at[kind]:
+            cached = self._revalidate_data_index(kind, cached)
+
+        index = cached[1]
+        data = index.get((product, target_lang))
+        if data is None:
+            # Normalize language code: "en-rUS" → "en"
+            data = index.get((product, target_lang.partition("-")[0]))
+            if data is not None:
+                # Remember the fallback so the next lookup is a single dict hit
+                index[(product, target_lang)] = data
+        if data is None:
+            return _EMPTY_MAPPING
+        return data
+
+    def _revalidate_data_index(
+        self,
+        kind: str,
+        cached: Optional[Tuple[int, Dict[Tuple[str, str], Mapping[str, Any]]]]
+    ) -> Tuple[int, Dict[Tuple[str, str], Mapping[str, Any]]]:
+        """Rebuild the data index if missing or its tree changed, and schedule the next check"""
+        if (cached is None
+                or _max_mtime_ns(self.config_dir.parent / "data" / kind) != cached[0]):
+            cached = self._data_index[kind] = self._build_data_index(kind)
+        self._data_index_recheck_at[kind] = time.monotonic() + _DATA_INDEX_RECHECK_S
+        return cached
+
+    def _build_data_index(
+        self,
+        kind: str
+    ) -> Tuple[int, Dict[Tuple[str, str], Mapping[str, Any]]]:
+        """
+        Parse every data/<kind>/<product>/<lang>.yaml|.yml in one pass.
+
+        Returns:
+            (max st_mtime_ns over the tree, {(product, lang): read-only data}).
+            A .yaml file takes precedence over a .yml file for the same language.
+            Files that fail to parse or are not a mapping are logged and skipped,
+            so one bad file does not break lookups for other products.
+        """
+        base = self.config_dir.parent / "data" / kind
+        index: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+        # Taken before parsing so an edit made mid-build is seen as a change
+        tree_mtime_ns = _max_mtime_ns(base)
+        try:
+            with os.scandir(base) as it:
+                product_dirs = [entry for entry in it if entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            return tree_mtime_ns, index
+
+        for product_dir in product_dirs:
+            with os.scandir(product_dir.path) as it:
+                for entry in it:
+                    lang, ext = os.path.splitext(entry.name)
+                    if ext not in _YAML_SUFFIXES or not entry.is_file():
+                        continue
+                    key = (product_dir.name, lang)
+                    if ext == ".yml" and key in index:
+                        continue
+                    try:
+                        # Per-file mtime cache: a rebuild only re-parses edited files
+                        data = self._load_yaml_file(Path(entry.path)) or {}
+                    except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+                        logger.warning(f"Skipping unreadable {kind} file {entry.path}: {e}")
+                        continue
+                    if not isinstance(data, dict):
+                        logger.warning(
+                            f"Skipping {kind} file {entry.path}: "
+                            f"expected a mapping, got {type(data).__name__}"
+                        )
+                        continue
+                    # Filter out comments (keys starting with #) once, at build time
+                    index[key] = MappingProxyType({
+                        k: v for k, v in data.items()
+                        if not (isinstance(k, str) and k.startswith("#"))
+                    })
+
+        return tree_mtime_ns, index
+
+    def _load_yaml_file(self, path: Path) -> Any:
+        """
+        Load a data YAML file, reusing the parsed result while its mtime is unchanged.
+
+        The cached object is shared; callers must copy before mutating.
+        """
+        key = str(path)
+        mtime_ns = os.stat(key).st_mtime_ns
+
+        cached = self._file_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        data = self._parse_yaml(path, mtime_ns)
+        self._file_cache[key] = (mtime_ns, data)
+        return data
+
+    def _parse_yaml(self, path: Path, mtime_ns: Optional[int] = None) -> Any:
+        """
+        Parse a YAML file, going through a JSON sidecar when CONFIG_CACHE_DIR is set.
+
+        The sidecar stores {"mtime_ns": source st_mtime_ns, "data": parsed data}
+        and is only used while the source mtime matches. JSON is used rather
+        than pickle so that loading a sidecar can never execute code. Data that
+        does not survive a JSON round trip unchanged (dates, non-str keys,
+        ...) gets no sidecar and is always parsed from YAML. Sidecars are
+        written atomically via os.replace. If the cache directory is not
+        writable, the disk cache is turned off and only the in-memory caches
+        are used.
+        """
+        if self._cache_dir is None:
+            return read_yaml(path)
+
+        key = os.path.abspath(path)
+        if mtime_ns is None:
+            mtime_ns = os.stat(key).st_mtime_ns
+        sidecar = os.path.join(
+            self._cache_dir,
+            hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json"
+        )
+
+        try:
+            with open(sidecar, "rb") as f:
+                cached = json.loads(f.read())
+            if cached["mtime_ns"] == mtime_ns:
+                return cached["data"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Corrupt or foreign sidecar: re-parse and overwrite it
+            logger.debug(f"Ignoring config cache {sidecar}: {e}")
+
+        data = read_yaml(key)
+
+        try:
+            payload = json.dumps(
+                {"mtime_ns": mtime_ns, "data": data},
+                ensure_ascii=False,
+                separators=(",", ":")
+            )
+        except (TypeError, ValueError):
+            return data
+        if json.loads(payload)["data"] != data:
+            # Lossy in JSON (e.g. int keys become strings): keep YAML as the source
+            return data
+
+        tmp_path = None
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload.encode("utf-8"))
+            os.replace(tmp_path, sidecar)
+        except OSError as e:
+            logger.debug(f"Config cache dir not writable, using memory only: {e}")
+            self._cache_dir = None
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        return data
+
+    def reload_if_changed(self) -> bool:
+        """
+        Drop cached data whose source directory changed since it was loaded.
+
+        Compares one max-mtime signature per tree (config/ and each indexed
+        data/<kind>/) instead of re-parsing. Cheap when nothing changed,
+        so it can be polled during live reload.
+
+        Returns:
+            True if any cache was invalidated
+        """
+        changed = False
+
+        if self._config_mtime_ns is not None:
+            if _max_mtime_ns(self.config_dir) != self._config_mtime_ns:
+                self.load.cache_clear()
+                self._config_mtime_ns = None
+                changed = True
+
+        for kind, (tree_mtime_ns, _) in list(self._data_index.items()):
+            if _max_mtime_ns(self.config_dir.parent / "data" / kind) != tree_mtime_ns:
+                del self._data_index[kind]
+                del self._data_index_recheck_at[kind]
+                changed = True
+
+        return changed
+
     def clear_cache(self):
         """Clear the config cache"""
         self.load.cache_clear()
+        self._file_cache.clear()
+        self._dir_cache.clear()
+        self._data_index.clear()
+        self._data_index_recheck_at.clear()
+        self._config_mtime_ns = None
 
 
-# Singleton instance
-_default_loader: Optional[ConfigLoader] = None
+# Config loaders keyed by absolute config_dir
+_loaders: Dict[str, ConfigLoader] = {}
+_loaders_lock = threading.Lock()
 
 
 def get_config_loader(config_dir: Optional[str] = None) -> ConfigLoader:
-    """Get or create the default config loader singleton"""
-    global _default_loader
-    if _default_loader is None:
-        _default_loader = ConfigLoader(config_dir)
-    return _default_loader
+    """
+    Get or create the config loader for a config directory.
+
+    One instance per directory: the argument (None = the default config
+    directory) is normalized to an absolute path, and creation is guarded by a lock (double-checked), so concurrent
+    workers share the same loader and caches. Lookups after creation take
+    no lock.
+    """
+    key = os.path.abspath(config_dir if config_dir is not None else _DEFAULT_CONFIG_DIR)
+    loader = _loaders.get(key)
+    if loader is None:
+        with _loaders_lock:
+            loader = _loaders.get(key)
+            if loader is None:
+                loader = _loaders[key] = ConfigLoader(config_dir)
+    return loader
+
+
+# Default loader, bound once at import
+_default_loader: ConfigLoader = get_config_loader()
 
 
 def get_config(name: str) -> Dict[str, Any]:
     """Convenience function to load a config file"""
-    loader = get_config_loader()
-    return loader.load(name)
+    return _default_loader.load(name)
 
 
 def get_thresholds() -> Dict[str, Any]:
     """Convenience function to get thresholds"""
-    loader = get_config_loader()
-    return loader.get_thresholds()
+    return _default_loader.get_thresholds()
 
 
 def get_risk_profile(country_code: str) -> Dict[str, Any]:
     """Convenience function to get a risk profile"""
-    loader = get_config_loader()
-    return loader.load_risk_profile(country_code)
+    return _default_loader.load_risk_profile(country_code)
 
 
-def get_glossary(product: str, target_lang: str) -> Dict[str, str]:
+def get_glossary(product: str, target_lang: str) -> Mapping[str, str]:
     """
     Convenience function to get a glossary.
 
@@ -283,17 +557,16 @@ def get_glossary(product: str, target_lang: str) -> Dict[str, str]:
         target_lang: Target language code (e.g., "en", "en-rUS", "ja")
 
     Returns:
-        Glossary dict mapping source terms to target terms
+        Read-only mapping of source terms to target terms (shared; copy to modify)
 
     Example:
         glossary = get_glossary("abc_cloud", "en-rUS")
         # Returns: {"ABC 클라우드": "ABC Cloud", "동기화": "sync", ...}
     """
-    loader = get_config_loader()
-    return loader.load_glossary(product, target_lang)
+    return _default_loader.load_glossary(product, target_lang)
 
 
-def get_style_guide(product: str, target_lang: str) -> Dict[str, str]:
+def get_style_guide(product: str, target_lang: str) -> Mapping[str, str]:
     """
     Convenience function to get a style guide.
 
@@ -302,11 +575,10 @@ def get_style_guide(product: str, target_lang: str) -> Dict[str, str]:
         target_lang: Target language code (e.g., "en", "en-rUS", "ja")
 
     Returns:
-        Style guide dict (e.g., {"tone": "formal", "voice": "active"})
+        Read-only style guide mapping (e.g., {"tone": "formal", "voice": "active"})
 
     Example:
         style = get_style_guide("abc_cloud", "en-rUS")
         # Returns: {"tone": "formal", "voice": "active", ...}
     """
-    loader = get_config_loader()
-    return loader.load_style_guide(product, target_lang)
+    return _default_loader.load_style_guide(product, target_lang)
@@ -16,14 +16,18 @@ Bedrock AgentCore observability 패턴 기반 (sample-deep-insight/managed-agent
 """
 
 import os
+import sys
+import uuid
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from contextlib import contextmanager
 
 # OpenTelemetry imports
 from opentelemetry import baggage, context, trace
 from opentelemetry.trace import Status, StatusCode
 
+from .strands_utils import TokenTracker
+
 # 로거 설정
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -38,13 +42,28 @@ DEFAULT_TRACER_MODULE_NAME = "translation_agent"
 DEFAULT_TRACER_VERSION = "1.0.0"
 
 # 터미널 출력용 ANSI 색상 코드
+_GREEN = '\033[92m'
+_YELLOW = '\033[93m'
+_CYAN = '\033[96m'
+_RED = '\033[91m'
+_END = '\033[0m'
+
+
 class Colors:
-    """터미널 출력용 ANSI 색상 코드"""
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    CYAN = '\033[96m'
-    RED = '\033[91m'
-    END = '\033[0m'
+    """터미널 출력용 ANSI 색상 코드 (하위 호환용 상수 네임스페이스)"""
+    __slots__ = ()
+
+    GREEN = _GREEN
+    YELLOW = _YELLOW
+    CYAN = _CYAN
+    RED = _RED
+    END = _END
+
+
+# 미리 만든 로그 포맷 (ANSI 색상 포함, %s 인자는 로깅 시점에만 포맷)
+_SESSION_CONTEXT_LOG_FORMAT = f"{_GREEN}%s '%s' 텔레메트리 컨텍스트에 연결됨{_END}"
+_NODE_START_LOG_FORMAT = f"{_GREEN}===== %s 시작 ====={_END}"
+_NODE_COMPLETE_LOG_FORMAT = f"{_GREEN}===== %s 완료 ====={_END}"
 
 
 # 1M 토큰당 가격 (비용 추정용)
@@ -69,6 +88,20 @@ MODEL_PRICING = {
     }
 }
 
+# 토큰당 가격 (1M으로 미리 나눔): model_key -> (input, output, cache_read, cache_write)
+_RATES: Dict[str, Tuple[float, float, float, float]] = {
+    key: (
+        p["input"] / 1_000_000,
+        p["output"] / 1_000_000,
+        p["cache_read"] / 1_000_000,
+        p["cache_write"] / 1_000_000,
+    )
+    for key, p in MODEL_PRICING.items()
+}
+
+# 원본 model_id -> 토큰당 가격 튜플 (처음 본 ID만 정규화)
+_MODEL_KEY_CACHE: Dict[str, Tuple[float, float, float, float]] = {}
+
 
 # =============================================================================
 # 세션 컨텍스트 (Baggage)
@@ -104,20 +137,23 @@ def set_session_context(
         # ... 작업 수행 ...
         context.detach(token)  # 완료 후 정리
     """
-    ctx = baggage.set_baggage("session.id", str(session_id))
-    logger.info(f"{Colors.GREEN}Session ID '{session_id}' 텔레메트리 컨텍스트에 연결됨{Colors.END}")
-
+    # (baggage 키, 로그 라벨, 값) - 비어 있는 항목은 제외
+    items = [("session.id", "Session ID", str(session_id))]
     if user_type:
-        ctx = baggage.set_baggage("user.type", user_type, context=ctx)
-        logger.info(f"{Colors.GREEN}User Type '{user_type}' 텔레메트리 컨텍스트에 연결됨{Colors.END}")
-
+        items.append(("user.type", "User Type", user_type))
     if workflow_type:
-        ctx = baggage.set_baggage("workflow.type", workflow_type, context=ctx)
-        logger.info(f"{Colors.GREEN}Workflow Type '{workflow_type}' 텔레메트리 컨텍스트에 연결됨{Colors.END}")
-
+        items.append(("workflow.type", "Workflow Type", workflow_type))
     if target_lang:
-        ctx = baggage.set_baggage("target.lang", target_lang, context=ctx)
-        logger.info(f"{Colors.GREEN}Target Lang '{target_lang}' 텔레메트리 컨텍스트에 연결됨{Colors.END}")
+        items.append(("target.lang", "Target Lang", target_lang))
+
+    # 로깅과 분리하여 컨텍스트를 한 번에 구성
+    ctx = context.get_current()
+    for key, _, value in items:
+        ctx = baggage.set_baggage(key, value, context=ctx)
+
+    if logger.isEnabledFor(logging.INFO):
+        for _, label, value in items:
+            logger.info(_SESSION_CONTEXT_LOG_FORMAT, label, value)
 
     return context.attach(ctx)
 
@@ -164,6 +200,44 @@ def get_tracer(
     )
 
 
+# =============================================================================
+# 트레이싱 활성화 확인
+# =============================================================================
+
+# 스팬 속성으로 그대로 전달 가능한 원시 타입
+_PRIMITIVE_TYPES = (str, bool, int, float)
+
+# 트레이싱 활성화 여부 캐시: 마지막으로 확인한 TracerProvider와 그 판정 결과
+_tracing_provider: Optional[trace.TracerProvider] = None
+_tracing_enabled = False
+
+
+def is_tracing_enabled() -> bool:
+    """
+    실제 TracerProvider가 설정되어 있는지 확인합니다.
+
+    설정 전에는 ProxyTracerProvider, OTEL_SDK_DISABLED 시에는
+    NoOpTracerProvider가 반환되며 이때 모든 스팬은 no-op입니다.
+    판정 결과(True/False 모두)를 provider 객체와 함께 캐싱하고,
+    provider 객체가 바뀐 경우에만 isinstance 검사를 다시 합니다.
+    TracerProvider는 한 번만 설정할 수 있으므로 True가 되면 더 확인하지 않습니다.
+    """
+    global _tracing_provider, _tracing_enabled
+    if _tracing_enabled:
+        return True
+    provider = trace.get_tracer_provider()
+    if provider is not _tracing_provider:
+        _tracing_provider = provider
+        _tracing_enabled = not isinstance(
+            provider, (trace.ProxyTracerProvider, trace.NoOpTracerProvider)
+        )
+    return _tracing_enabled
+
+
+def _noop_record_event(event_type: str, attributes: Dict[str, Any] = None) -> None:
+    """트레이싱 비활성화 시 사용하는 no-op 이벤트 기록기"""
+
+
 # =============================================================================
 # 스팬 헬퍼
 # =============================================================================
@@ -190,15 +264,15 @@ def add_span_event(
             result = translate(source_text)
             add_span_event(span, "response", {"text": result, "length": len(result)})
     """
+    if not is_tracing_enabled():
+        return
+
     if span and span.is_recording():
-        # 속성 값이 원시 타입인지 확인
-        safe_attrs = {}
-        if attributes:
-            for key, value in attributes.items():
-                if isinstance(value, (str, bool, int, float)):
-                    safe_attrs[key] = value
-                else:
-                    safe_attrs[key] = str(value)[:1000]  # 긴 문자열 잘라내기
+        # 속성 값이 원시 타입인지 확인 (긴 문자열 잘라내기)
+        safe_attrs = {
+            key: value if isinstance(value, _PRIMITIVE_TYPES) else str(value)[:1000]
+            for key, value in attributes.items()
+        } if attributes else {}
 
         span.add_event(event_name, safe_attrs)
     else:
@@ -226,9 +300,12 @@ def set_span_attribute(
             set_span_attribute(span, "target_lang", "en-rUS")
             set_span_attribute(span, "input_length", len(text))
     """
+    if not is_tracing_enabled():
+        return
+
     if span and span.is_recording():
         # 값이 원시 타입인지 확인
-        if isinstance(value, (str, bool, int, float)):
+        if isinstance(value, _PRIMITIVE_TYPES):
             span.set_attribute(key, value)
         else:
             span.set_attribute(key, str(value)[:1000])
@@ -258,6 +335,9 @@ def set_span_status(
                 set_span_status(span, False, str(e))
                 raise
     """
+    if not is_tracing_enabled():
+        return
+
     if span and span.is_recording():
         if success:
             span.set_status(Status(StatusCode.OK))
@@ -281,6 +361,9 @@ def record_exception(span: trace.Span, exception: Exception) -> None:
                 record_exception(span, e)
                 raise
     """
+    if not is_tracing_enabled():
+        return
+
     if span and span.is_recording():
         span.record_exception(exception)
         span.set_status(Status(StatusCode.ERROR, str(exception)))
@@ -314,6 +397,11 @@ def trace_agent(
             result = translator(source_text)
             record("output", {"text": result, "score": 4})
     """
+    if not is_tracing_enabled():
+        # 트레이싱 비활성화: 스팬 생성 없이 no-op 스팬/기록기 반환
+        yield trace.INVALID_SPAN, _noop_record_event
+        return
+
     if tracer is None:
         tracer = get_tracer()
 
@@ -356,18 +444,22 @@ def trace_workflow(
             with trace_agent("translator") as (agent_span, record):
                 result = translate(text)
     """
-    import uuid
-
-    if tracer is None:
-        tracer = get_tracer()
-
+    # 세션 ID는 트레이싱 여부와 무관하게 프로세스/실행 간 고유해야 하므로 항상 UUID4 사용
     if session_id is None:
         session_id = str(uuid.uuid4())
 
-    # 세션 컨텍스트 설정
+    # 세션 컨텍스트 설정 (트레이싱 비활성화 시에도 baggage는 전파)
     token = set_session_context(session_id, workflow_type=workflow_name)
 
     try:
+        if not is_tracing_enabled():
+            # 트레이싱 비활성화: 스팬 생성 없이 no-op 스팬 반환
+            yield trace.INVALID_SPAN, session_id
+            return
+
+        if tracer is None:
+            tracer = get_tracer()
+
         with tracer.start_as_current_span(workflow_name) as span:
             set_span_attribute(span, "session.id", session_id)
 
@@ -392,8 +484,9 @@ def log_node_start(node_name: str) -> None:
     Args:
         node_name: 노드 이름 (예: "Translator", "Evaluator")
     """
-    print()  # 로그 전 줄바꿈 추가
-    logger.info(f"{Colors.GREEN}===== {node_name} 시작 ====={Colors.END}")
+    if logger.isEnabledFor(logging.INFO):
+        sys.stdout.write("\n")  # 로그 전 줄바꿈 추가
+        logger.info(_NODE_START_LOG_FORMAT, node_name)
 
 
 def log_node_complete(node_name: str, shared_state: Optional[Dict] = None) -> None:
@@ -407,12 +500,12 @@ def log_node_complete(node_name: str, shared_state: Optional[Dict] = None) -> No
         node_name: 노드 이름
         shared_state: token_usage를 포함하는 선택적 공유 상태
     """
-    print()  # 로그 전 줄바꿈 추가
-    logger.info(f"{Colors.GREEN}===== {node_name} 완료 ====={Colors.END}")
+    if logger.isEnabledFor(logging.INFO):
+        sys.stdout.write("\n")  # 로그 전 줄바꿈 추가
+        logger.info(_NODE_COMPLETE_LOG_FORMAT, node_name)
 
     # 토큰 사용량이 있으면 출력
     if shared_state:
-        from .strands_utils import TokenTracker
         TokenTracker.print_current(shared_state)
 
 
@@ -420,6 +513,26 @@ def log_node_complete(node_name: str, shared_state: Optional[Dict] = None) -> No
 # 비용 계산 헬퍼
 # =============================================================================
 
+def _rates_for(model_id: str) -> Tuple[float, float, float, float]:
+    """
+    모델 ID를 정규화하여 토큰당 가격 튜플을 반환합니다 (처음 본 ID만 정규화 후 캐싱).
+
+    Returns:
+        (input, output, cache_read, cache_write) 토큰당 가격 튜플
+    """
+    # 모델 ID 정규화
+    model_id_lower = model_id.lower()
+    model_key = "default"
+    if "opus" in model_id_lower:
+        model_key = "claude-opus-4-5"
+    elif "sonnet" in model_id_lower:
+        model_key = "claude-sonnet-4-5"
+
+    rates = _RATES.get(model_key, _RATES["default"])
+    _MODEL_KEY_CACHE[model_id] = rates
+    return rates
+
+
 def calculate_cost(
     model_id: str,
     input_tokens: int,
@@ -438,7 +551,7 @@ def calculate_cost(
         cache_write_tokens: 캐시 쓰기 토큰 수 (25% 추가)
 
     Returns:
-        예상 비용 (USD)
+        예상 비용 (USD, 반올림하지 않음 - 출력 시 포맷)
 
     Example:
         cost = calculate_cost(
@@ -449,24 +562,18 @@ def calculate_cost(
         )
         print(f"비용: ${cost:.4f}")
     """
-    # 모델 ID 정규화
-    model_key = "default"
-    if "opus" in model_id.lower():
-        model_key = "claude-opus-4-5"
-    elif "sonnet" in model_id.lower():
-        model_key = "claude-sonnet-4-5"
-
-    pricing = MODEL_PRICING.get(model_key, MODEL_PRICING["default"])
-
-    cost = (
-        (input_tokens / 1_000_000) * pricing["input"] +
-        (output_tokens / 1_000_000) * pricing["output"] +
-        (cache_read_tokens / 1_000_000) * pricing["cache_read"] +
-        (cache_write_tokens / 1_000_000) * pricing["cache_write"]
+    rates = _MODEL_KEY_CACHE.get(model_id)
+    if rates is None:
+        rates = _rates_for(model_id)
+    input_rate, output_rate, cache_read_rate, cache_write_rate = rates
+
+    return (
+        input_tokens * input_rate +
+        output_tokens * output_rate +
+        cache_read_tokens * cache_read_rate +
+        cache_write_tokens * cache_write_rate
     )
 
-    return round(cost, 6)
-
 
 # =============================================================================
 # 내보내기
@@ -481,6 +588,7 @@ __all__ = [
     "get_session_id",
     # Tracer
     "get_tracer",
+    "is_tracing_enabled",
     # 스팬 헬퍼
     "add_span_event",
     "set_span_attribute",
@@ -7,13 +7,13 @@ config/pricing.json에서 가격 정보 로드.
 
 import json
 import os
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple, FrozenSet
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CostBreakdown:
-    """비용 상세 내역"""
+    """비용 상세 내역 (불변, __slots__ 사용)"""
     input_cost: float
     output_cost: float
     cache_read_cost: float
@@ -33,6 +33,10 @@ class CostBreakdown:
 # 싱글톤 가격 데이터
 _pricing_data: Optional[Dict] = None
 
+# 모델별 가격 튜플 (load_pricing 시 구성)
+# model_key -> (input, output, cache_read, cache_write_5m, batch_input, batch_output)
+_model_table: Dict[str, Tuple[float, float, float, float, float, float]] = {}
+
 
 def load_pricing(config_path: Optional[str] = None) -> Dict:
     """
@@ -56,9 +60,32 @@ def load_pricing(config_path: Optional[str] = None) -> Dict:
     with open(config_path, "r", encoding="utf-8") as f:
         _pricing_data = json.load(f)
 
+    _model_table.clear()
+    _blended_rates.clear()
+    for model_key, p in _pricing_data["models"].items():
+        _model_table[model_key] = (
+            p["input"],
+            p["output"],
+            p["cache_read"],
+            p["cache_write_5m"],  # 기본 5분 TTL
+            p["batch_input"],
+            p["batch_output"],
+        )
+
     return _pricing_data
 
 
+def _get_model_rates(model_key: str) -> Tuple[float, float, float, float, float, float]:
+    """모델 가격 튜플 조회 (없으면 ValueError)"""
+    try:
+        return _model_table[model_key]
+    except KeyError:
+        load_pricing()
+        if model_key in _model_table:
+            return _model_table[model_key]
+        raise ValueError(f"Unknown model: {model_key}. Available: {list(_model_table.keys())}") from None
+
+
 def get_model_pricing(model_key: str) -> Dict:
     """
     특정 모델의 가격 정보 조회
@@ -102,30 +129,22 @@ def calculate_cost(
         >>> cost = calculate_cost(usage, "claude-sonnet-4-5")
         >>> print(f"Total: ${cost.total_cost:.4f}")
     """
-    pricing = get_model_pricing(model_key)
+    rates = _get_model_rates(model_key)
+    # 배치 가격이면 batch_input/batch_output 사용
+    input_rate, output_rate = (rates[4], rates[5]) if use_batch else (rates[0], rates[1])
+
+    # 가격 계산 (가격은 MTok (백만 토큰) 단위)
+    input_cost = token_usage.get("input", 0) * input_rate / 1_000_000
+    output_cost = token_usage.get("output", 0) * output_rate / 1_000_000
 
-    # 토큰 추출
-    input_tokens = token_usage.get("input", 0)
-    output_tokens = token_usage.get("output", 0)
+    # 캐시 토큰이 없는 경우(일반적)는 계산 생략
     cache_read_tokens = token_usage.get("cache_read", 0)
     cache_write_tokens = token_usage.get("cache_write", 0)
-
-    # MTok (백만 토큰) 단위로 변환
-    input_mtok = input_tokens / 1_000_000
-    output_mtok = output_tokens / 1_000_000
-    cache_read_mtok = cache_read_tokens / 1_000_000
-    cache_write_mtok = cache_write_tokens / 1_000_000
-
-    # 가격 계산
-    if use_batch:
-        input_cost = input_mtok * pricing["batch_input"]
-        output_cost = output_mtok * pricing["batch_output"]
+    if cache_read_tokens or cache_write_tokens:
+        cache_read_cost = cache_read_tokens * rates[2] / 1_000_000
+        cache_write_cost = cache_write_tokens * rates[3] / 1_000_000
     else:
-        input_cost = input_mtok * pricing["input"]
-        output_cost = output_mtok * pricing["output"]
-
-    cache_read_cost = cache_read_mtok * pricing["cache_read"]
-    cache_write_cost = cache_write_mtok * pricing["cache_write_5m"]  # 기본 5분 TTL
+        cache_read_cost = cache_write_cost = 0.0
 
     total_cost = input_cost + output_cost + cache_read_cost + cache_write_cost
 
@@ -138,6 +157,47 @@ def calculate_cost(
     )
 
 
+# 기본 분배 추정 (워크플로우 기반)
+# Opus: translator + quality_evaluator (~40%)
+# Sonnet: backtranslator + accuracy + compliance (~60%)
+_DEFAULT_MODEL_DISTRIBUTION: Dict[str, float] = {
+    "claude-opus-4-5": 0.40,
+    "claude-sonnet-4-5": 0.60
+}
+
+# 모델 분배별 혼합 토큰당 가격 캐시
+# frozenset(model_distribution.items()) -> (input, output, cache_read, cache_write)
+_blended_rates: Dict[FrozenSet[Tuple[str, float]], Tuple[float, float, float, float]] = {}
+
+
+def _get_blended_rates(model_distribution: Dict[str, float]) -> Tuple[float, float, float, float]:
+    """
+    모델 분배 비율로 가중 평균한 토큰당 가격 조회 (분배별 캐싱)
+
+    비율 합산을 가격에 미리 적용하므로 비용 계산은 토큰 종류별 곱셈 4번으로 끝남.
+    """
+    key = frozenset(model_distribution.items())
+    rates = _blended_rates.get(key)
+    if rates is None:
+        input_rate = output_rate = cache_read_rate = cache_write_rate = 0.0
+        for model_key, ratio in model_distribution.items():
+            model_rates = _get_model_rates(model_key)
+            input_rate += ratio * model_rates[0]
+            output_rate += ratio * model_rates[1]
+            cache_read_rate += ratio * model_rates[2]
+            cache_write_rate += ratio * model_rates[3]
+
+        # MTok (백만 토큰) 단위 가격을 토큰당 가격으로 변환
+        rates = (
+            input_rate / 1_000_000,
+            output_rate / 1_000_000,
+            cache_read_rate / 1_000_000,
+            cache_write_rate / 1_000_000,
+        )
+        _blended_rates[key] = rates
+    return rates
+
+
 def calculate_workflow_cost(
     token_usage: Dict[str, int],
     model_distribution: Optional[Dict[str, float]] = None
@@ -159,39 +219,64 @@ def calculate_workflow_cost(
     Returns:
         CostBreakdown: 비용 상세 내역
     """
-    if model_distribution is None:
-        # 기본 분배 추정 (워크플로우 기반)
-        # Opus: translator + quality_evaluator (~40%)
-        # Sonnet: backtranslator + accuracy + compliance (~60%)
-        model_distribution = {
-            "claude-opus-4-5": 0.40,
-            "claude-sonnet-4-5": 0.60
-        }
+    return calculate_workflow_cost_from_tokens(
+        token_usage.get("input", 0),
+        token_usage.get("output", 0),
+        token_usage.get("cache_read", 0),
+        token_usage.get("cache_write", 0),
+        model_distribution
+    )
 
-    total_input = token_usage.get("input", 0)
-    total_output = token_usage.get("output", 0)
-    total_cache_read = token_usage.get("cache_read", 0)
-    total_cache_write = token_usage.get("cache_write", 0)
 
-    total_cost = CostBreakdown(0, 0, 0, 0, 0)
+def calculate_workflow_cost_from_tokens(
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
+    model_distribution: Optional[Dict[str, float]] = None
+) -> CostBreakdown:
+    """
+    토큰 수를 직접 받아 워크플로우 비용 계산 (토큰 딕셔너리 생성 없이)
 
-    for model_key, ratio in model_distribution.items():
-        model_usage = {
-            "input": int(total_input * ratio),
-            "output": int(total_output * ratio),
-            "cache_read": int(total_cache_read * ratio),
-            "cache_write": int(total_cache_write * ratio)
-        }
+    배치 집계처럼 토큰 합계를 지역 변수로 누적한 경우에 사용.
 
-        cost = calculate_cost(model_usage, model_key)
+    Args:
+        input_tokens: 입력 토큰
+        output_tokens: 출력 토큰
+        cache_read_tokens: 캐시 읽기 토큰
+        cache_write_tokens: 캐시 쓰기 토큰
+        model_distribution: 모델별 토큰 비율 (기본: 추정치 사용)
 
-        total_cost.input_cost += cost.input_cost
-        total_cost.output_cost += cost.output_cost
-        total_cost.cache_read_cost += cost.cache_read_cost
-        total_cost.cache_write_cost += cost.cache_write_cost
-        total_cost.total_cost += cost.total_cost
+    Returns:
+        CostBreakdown: 비용 상세 내역
+    """
+    if model_distribution is None:
+        model_distribution = _DEFAULT_MODEL_DISTRIBUTION
 
-    return total_cost
+    input_rate, output_rate, cache_read_rate, cache_write_rate = _get_blended_rates(model_distribution)
+
+    input_cost = input_tokens * input_rate
+    output_cost = output_tokens * output_rate
+    cache_read_cost = cache_read_tokens * cache_read_rate
+    cache_write_cost = cache_write_tokens * cache_write_rate
+
+    return CostBreakdown(
+        input_cost=input_cost,
+        output_cost=output_cost,
+        cache_read_cost=cache_read_cost,
+        cache_write_cost=cache_write_cost,
+        total_cost=input_cost + output_cost + cache_read_cost + cache_write_cost
+    )
+
+
+# 상세 내역 포맷 (한 번만 구성, str.format으로 한 번에 렌더링)
+_COST_BREAKDOWN_FORMAT = "\n".join((
+    "Total: ${0.total_cost:.6f}",
+    "  Input:       ${0.input_cost:.6f}",
+    "  Output:      ${0.output_cost:.6f}",
+    "  Cache Read:  ${0.cache_read_cost:.6f}",
+    "  Cache Write: ${0.cache_write_cost:.6f}",
+))
 
 
 def format_cost(cost: CostBreakdown, include_breakdown: bool = False) -> str:
@@ -206,12 +291,6 @@ def format_cost(cost: CostBreakdown, include_breakdown: bool = False) -> str:
         포맷된 비용 문자열
     """
     if include_breakdown:
-        return (
-            f"Total: ${cost.total_cost:.6f}\n"
-            f"  Input:       ${cost.input_cost:.6f}\n"
-            f"  Output:      ${cost.output_cost:.6f}\n"
-            f"  Cache Read:  ${cost.cache_read_cost:.6f}\n"
-            f"  Cache Write: ${cost.cache_write_cost:.6f}"
-        )
+        return _COST_BREAKDOWN_FORMAT.format(cost)
     else:
         return f"${cost.total_cost:.6f}"
@@ -5,15 +5,51 @@ test_workflow.py 및 다른 스크립트에서 재사용 가능.
 """
 
 import json
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from src.models.workflow_state import WorkflowState
-from src.utils.pricing import calculate_workflow_cost
+from src.utils.pricing import calculate_workflow_cost, calculate_workflow_cost_from_tokens
 
+# orjson은 선택 사항 (설치되어 있으면 빠른 직렬화 사용)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def format_workflow_result(result: dict) -> dict:
+
+def _json_default(obj: Any) -> Any:
+    """JSON 기본 직렬화 불가 타입 처리 (Enum은 value, 그 외는 str)"""
+    return obj.value if hasattr(obj, "value") else str(obj)
+
+
+def dumps_json(obj: Any, indent: bool = True) -> bytes:
+    """
+    JSON을 UTF-8 bytes로 직렬화.
+
+    orjson이 있으면 C 구현으로 직렬화하고, 없으면 표준 json으로 폴백합니다.
+    결과 파일 저장(바이너리 쓰기)과 stdout 출력에 공통으로 사용합니다.
+
+    Args:
+        obj: 직렬화할 객체
+        indent: True면 2칸 들여쓰기 (stdout 출력용), False면 공백 없는 한 줄 (save_result의 단일 결과 파일)
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=_json_default)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default).encode("utf-8")
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=_json_default
+    ).encode("utf-8")
+
+
+def format_workflow_result(result: dict, created_at: Optional[str] = None) -> dict:
     """
     워크플로우 결과를 JSON 직렬화 가능한 dict로 변환.
 
@@ -23,33 +59,37 @@ def format_workflow_result(result: dict) -> dict:
 
     Args:
         result: TranslationWorkflowGraph.run() 반환값
+        created_at: ISO 타임스탬프 (배치에서 한 번 계산해 모든 항목에 전달, 기본: 현재 시각)
 
     Returns:
         JSON 직렬화 가능한 dict
     """
-    state_value = result["workflow_state"].value
+    unit = result["unit"]
+    tr = result.get("translation_result")
+    bt = result.get("backtranslation_result")
+    gd = result.get("gate_decision")
+    m = result.get("metrics")
 
     # === SUMMARY (상단) ===
     output = {
-        "key": result["unit"].key,
-        "source_text": result["unit"].source_text,
+        "key": unit.key,
+        "source_text": unit.source_text,
         "translation": None,
-        "workflow_state": state_value,
+        "workflow_state": result["workflow_state"].value,
         "attempt_count": result.get("attempt_count", 1),
         "scores": {},
         "verdict": None,
         "can_publish": False,
         "total_latency_ms": 0,
-        "created_at": datetime.now().isoformat(),
+        "created_at": created_at or datetime.now().isoformat(),
     }
 
     # 번역 결과 (summary)
-    if "translation_result" in result:
-        output["translation"] = result["translation_result"].translation
+    if tr is not None:
+        output["translation"] = tr.translation
 
     # 게이트 판정 (summary)
-    if "gate_decision" in result:
-        gd = result["gate_decision"]
+    if gd is not None:
         output["scores"] = gd.scores
         output["verdict"] = gd.verdict.value
         output["can_publish"] = gd.can_publish
@@ -57,14 +97,13 @@ def format_workflow_result(result: dict) -> dict:
 
     # === DETAILS (하단) ===
     details = {
-        "source_lang": result["unit"].source_lang,
-        "target_lang": result["unit"].target_lang,
-        "glossary": result["unit"].glossary,
+        "source_lang": unit.source_lang,
+        "target_lang": unit.target_lang,
+        "glossary": unit.glossary,
     }
 
     # 번역 상세
-    if "translation_result" in result:
-        tr = result["translation_result"]
+    if tr is not None:
         details["translation"] = {
             "candidates": tr.candidates,
             "notes": tr.notes,
@@ -72,8 +111,7 @@ def format_workflow_result(result: dict) -> dict:
         }
 
     # 역번역 상세
-    if "backtranslation_result" in result:
-        bt = result["backtranslation_result"]
+    if bt is not None:
         details["backtranslation"] = {
             "text": bt.backtranslation,
             "notes": bt.notes,
@@ -99,8 +137,7 @@ def format_workflow_result(result: dict) -> dict:
             details["evaluations"].append(eval_dict)
 
     # 게이트 판정 상세
-    if "gate_decision" in result:
-        gd = result["gate_decision"]
+    if gd is not None:
         details["gate_decision"] = {
             "verdict": gd.verdict.value,
             "can_publish": gd.can_publish,
@@ -129,9 +166,7 @@ def format_workflow_result(result: dict) -> dict:
         ]
 
     # 메트릭 상세
-    if "metrics" in result:
-        m = result["metrics"]
-
+    if m is not None:
         # 비용 계산
         cost = calculate_workflow_cost(m.token_usage)
 
@@ -158,15 +193,15 @@ def format_workflow_result(result: dict) -> dict:
 
 
 def calculate_batch_stats(results: List[dict]) -> dict:
-    """배치 결과 통계 계산"""
-    total = len(results)
+    """배치 결과 통계 계산 (한 번의 순회로 상태별 집계)"""
+    counts = Counter(r.get("workflow_state") for r in results)
     return {
-        "total": total,
-        "published": sum(1 for r in results if r.get("workflow_state") == WorkflowState.PUBLISHED),
-        "rejected": sum(1 for r in results if r.get("workflow_state") == WorkflowState.REJECTED),
-        "pending": sum(1 for r in results if r.get("workflow_state") == WorkflowState.PENDING_REVIEW),
-        "failed": sum(1 for r in results if r.get("workflow_state") == WorkflowState.FAILED),
-        "regenerating": sum(1 for r in results if r.get("workflow_state") == WorkflowState.REGENERATING),
+        "total": len(results),
+        "published": counts[WorkflowState.PUBLISHED],
+        "rejected": counts[WorkflowState.REJECTED],
+        "pending": counts[WorkflowState.PENDING_REVIEW],
+        "failed": counts[WorkflowState.FAILED],
+        "regenerating": counts[WorkflowState.REGENERATING],
     }
 
 
@@ -174,25 +209,37 @@ def save_batch_summary(results: List[dict], run_dir: Path) -> Path:
     """배치 결과 요약을 JSON 파일로 저장"""
     stats = calculate_batch_stats(results)
 
-    # 평균 점수 계산
-    all_scores = []
-    for r in results:
-        if "gate_decision" in r:
-            all_scores.append(r["gate_decision"].avg_score)
-    avg_score = sum(all_scores) / len(all_scores) if all_scores else 0
-
-    # 총 지연시간 및 토큰
+    # 평균 점수, 총 지연시간 및 토큰 (한 번의 순회로 집계)
+    score_sum = 0.0
+    score_count = 0
     total_latency = 0
-    total_tokens = {"input": 0, "output": 0, "cache_read": 0, "cache_write": 0}
+    input_tokens = output_tokens = cache_read_tokens = cache_write_tokens = 0
 
     for r in results:
+        if "gate_decision" in r:
+            score_sum += r["gate_decision"].avg_score
+            score_count += 1
         if "metrics" in r:
-            total_latency += r["metrics"].total_latency_ms
-            for key in total_tokens:
-                total_tokens[key] += r["metrics"].token_usage.get(key, 0)
+            metrics = r["metrics"]
+            token_usage = metrics.token_usage
+            total_latency += metrics.total_latency_ms
+            input_tokens += token_usage.get("input", 0)
+            output_tokens += token_usage.get("output", 0)
+            cache_read_tokens += token_usage.get("cache_read", 0)
+            cache_write_tokens += token_usage.get("cache_write", 0)
+
+    avg_score = score_sum / score_count if score_count else 0
+    total_tokens = {
+        "input": input_tokens,
+        "output": output_tokens,
+        "cache_read": cache_read_tokens,
+        "cache_write": cache_write_tokens,
+    }
 
-    # 총 비용 계산
-    total_cost = calculate_workflow_cost(total_tokens)
+    # 총 비용 계산 (누적한 토큰 합계를 그대로 전달)
+    total_cost = calculate_workflow_cost_from_tokens(
+        input_tokens, output_tokens, cache_read_tokens, cache_write_tokens
+    )
 
     summary = {
         "run_id": run_dir.name,
@@ -212,8 +259,8 @@ def save_batch_summary(results: List[dict], run_dir: Path) -> Path:
         "items": [r["unit"].key for r in results]
     }
 
+    # json.dump는 요소마다 write()를 호출하므로 한 번에 직렬화 후 단일 쓰기
     file_path = run_dir / "_summary.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, ensure_ascii=False, indent=2)
+    file_path.write_bytes(dumps_json(summary))
 
     return file_path
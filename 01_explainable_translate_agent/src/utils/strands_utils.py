@@ -11,14 +11,15 @@ sample-deep-insight/self-hosted의 프로덕션 검증 패턴 기반.
 """
 
 import logging
-import traceback
 import asyncio
-import yaml
 import os
-import uuid
-from typing import Optional, Dict, Any, List
+import random
+import sys
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterable, List, Mapping, TypedDict
 from dataclasses import dataclass, field
 from contextlib import contextmanager
+from functools import lru_cache
 
 from strands import Agent
 from strands.models import BedrockModel
@@ -27,6 +28,8 @@ from strands.types.exceptions import EventLoopException
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
+from src.utils.config import read_yaml
+
 # OpenTelemetry imports for AgentCore Observability
 try:
     from opentelemetry import trace, context, baggage
@@ -43,11 +46,14 @@ logger = logging.getLogger(__name__)
 # AgentCore Observability (OpenTelemetry Integration)
 # =============================================================================
 
+@lru_cache(maxsize=None)
 def get_tracer(name: str = "translation-agent") -> Optional[Any]:
     """
-    OpenTelemetry Tracer 가져오기.
+    OpenTelemetry Tracer 가져오기 (이름별 캐싱).
 
     OTEL이 설치되지 않은 경우 None 반환.
+    TracerProvider 설정 전에 가져온 tracer도 이후 설정된 provider로
+    위임(ProxyTracer)되므로 캐싱해도 안전합니다.
     """
     if not OTEL_AVAILABLE:
         return None
@@ -56,6 +62,8 @@ def get_tracer(name: str = "translation-agent") -> Optional[Any]:
 
 def generate_session_id() -> str:
     """고유 세션 ID 생성"""
+    import uuid  # 세션당 한 번만 호출되므로 지연 임포트
+
     return str(uuid.uuid4())
 
 
@@ -87,13 +95,15 @@ def observability_session(
 
     session_id = session_id or generate_session_id()
 
-    # Baggage에 세션 정보 설정
-    ctx = baggage.set_baggage("session.id", session_id)
-    ctx = baggage.set_baggage("workflow.name", workflow_name, context=ctx)
-
+    # Baggage에 세션 정보 설정 (항목을 모은 뒤 현재 컨텍스트에서 한 번에 구성)
+    bag = {"session.id": session_id, "workflow.name": workflow_name}
     if metadata:
         for key, value in metadata.items():
-            ctx = baggage.set_baggage(f"custom.{key}", value, context=ctx)
+            bag[f"custom.{key}"] = value
+
+    ctx = context.get_current()
+    for key, value in bag.items():
+        ctx = baggage.set_baggage(key, value, context=ctx)
 
     token = context.attach(ctx)
 
@@ -174,23 +184,33 @@ def record_exception(exception: Exception):
 # 설정
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
-    """특정 모델 역할에 대한 설정"""
+    """특정 모델 역할에 대한 설정 (불변)"""
     model_id: str
     max_tokens: int = 2000
     temperature: float = 0.1
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StrandsConfig:
-    """전체 Strands 설정"""
+    """
+    전체 Strands 설정 (불변, 해시 가능)
+
+    models는 읽기 전용 매핑으로 저장되며 해시에서 제외됩니다.
+    해시 가능하므로 모델 캐시의 키로 사용할 수 있습니다.
+    """
     region: str = "us-west-2"
-    models: Dict[str, ModelConfig] = field(default_factory=dict)
+    models: Mapping[str, ModelConfig] = field(default_factory=dict, hash=False)
     retry_max_attempts: int = 50
+    max_retry_total_tokens: Optional[int] = None
     timeout_seconds: int = 900
 
+    def __post_init__(self):
+        # frozen이므로 object.__setattr__로 읽기 전용 뷰 설정
+        object.__setattr__(self, "models", MappingProxyType(dict(self.models)))
+
 
 def load_config(config_path: Optional[str] = None) -> StrandsConfig:
     """
@@ -206,12 +226,12 @@ def load_config(config_path: Optional[str] = None) -> StrandsConfig:
         base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
         config_path = os.path.join(base_dir, "config", "models.yaml")
 
+    # config.py와 같은 파서 사용 (libyaml CSafeLoader 우선)
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            raw_config = yaml.safe_load(f)
+        raw_config = read_yaml(config_path) or {}
     except FileNotFoundError:
         logger.warning(f"설정 파일을 찾을 수 없음: {config_path}, 기본값 사용")
-        return _default_config()
+        return _DEFAULT_CONFIG
 
     # 모델 파싱
     models = {}
@@ -230,60 +250,69 @@ def load_config(config_path: Optional[str] = None) -> StrandsConfig:
         region=raw_config.get("region", "us-west-2"),
         models=models,
         retry_max_attempts=retry_cfg.get("max_attempts", 50),
+        max_retry_total_tokens=retry_cfg.get("max_total_tokens"),
         timeout_seconds=900
     )
 
 
-def _default_config() -> StrandsConfig:
-    """기본 설정 반환"""
-    return StrandsConfig(
-        region="us-west-2",
-        models={
-            "translator": ModelConfig(
-                model_id="us.anthropic.claude-opus-4-5-20250514-v1:0",
-                max_tokens=2000,
-                temperature=0.3
-            ),
-            "backtranslator": ModelConfig(
-                model_id="us.anthropic.claude-sonnet-4-5-20250514-v1:0",
-                max_tokens=1000,
-                temperature=0.1
-            ),
-            "accuracy_evaluator": ModelConfig(
-                model_id="us.anthropic.claude-sonnet-4-5-20250514-v1:0",
-                max_tokens=1500,
-                temperature=0.1
-            ),
-            "compliance_evaluator": ModelConfig(
-                model_id="us.anthropic.claude-sonnet-4-5-20250514-v1:0",
-                max_tokens=1500,
-                temperature=0.1
-            ),
-            "quality_evaluator": ModelConfig(
-                model_id="us.anthropic.claude-opus-4-5-20250514-v1:0",
-                max_tokens=1500,
-                temperature=0.1
-            )
-        }
-    )
-
-
-# 싱글톤 설정 인스턴스
-_config: Optional[StrandsConfig] = None
+# 기본 설정 (models.yaml이 없을 때 사용, 모듈 로드 시 한 번만 생성)
+_DEFAULT_CONFIG = StrandsConfig(
+    region="us-west-2",
+    models={
+        "translator": ModelConfig(
+            model_id="us.anthropic.claude-opus-4-5-20250514-v1:0",
+            max_tokens=2000,
+            temperature=0.3
+        ),
+        "backtranslator": ModelConfig(
+            model_id="us.anthropic.claude-sonnet-4-5-20250514-v1:0",
+            max_tokens=1000,
+            temperature=0.1
+        ),
+        "accuracy_evaluator": ModelConfig(
+            model_id="us.anthropic.claude-sonnet-4-5-20250514-v1:0",
+            max_tokens=1500,
+            temperature=0.1
+        ),
+        "compliance_evaluator": ModelConfig(
+            model_id="us.anthropic.claude-sonnet-4-5-20250514-v1:0",
+            max_tokens=1500,
+            temperature=0.1
+        ),
+        "quality_evaluator": ModelConfig(
+            model_id="us.anthropic.claude-opus-4-5-20250514-v1:0",
+            max_tokens=1500,
+            temperature=0.1
+        )
+    }
+)
 
 
+@lru_cache(maxsize=1)
 def get_config(config_path: Optional[str] = None) -> StrandsConfig:
-    """설정 싱글톤 가져오기 또는 로드"""
-    global _config
-    if _config is None:
-        _config = load_config(config_path)
-    return _config
+    """설정 싱글톤 가져오기 또는 로드 (lru_cache로 최초 1회만 로드)"""
+    return load_config(config_path)
 
 
 # =============================================================================
 # 모델 및 에이전트 생성 (프로덕션 검증 패턴)
 # =============================================================================
 
+# 미리 만든 캐시 포인트 블록 (공유 객체 - 수정 금지)
+_CACHE_POINTS: Dict[str, SystemContentBlock] = {
+    "default": SystemContentBlock(cachePoint={"type": "default"}),
+    "ephemeral": SystemContentBlock(cachePoint={"type": "ephemeral"}),
+}
+
+
+def _get_cache_point(cache_type: str) -> SystemContentBlock:
+    """캐시 유형별 캐시 포인트 블록 반환 (알 수 없는 유형은 새로 생성)"""
+    block = _CACHE_POINTS.get(cache_type)
+    if block is None:
+        block = SystemContentBlock(cachePoint={"type": cache_type})
+    return block
+
+
 def get_model(
     role: str,
     streaming: bool = True,
@@ -313,6 +342,19 @@ def get_model(
     if config is None:
         config = get_config()
 
+    # 역할/옵션/설정별로 캐싱된 모델 재사용 (boto 클라이언트 재생성 방지)
+    return _build_model(role, streaming, tool_cache, enable_reasoning, config)
+
+
+@lru_cache(maxsize=16)
+def _build_model(
+    role: str,
+    streaming: bool,
+    tool_cache: bool,
+    enable_reasoning: bool,
+    config: StrandsConfig
+) -> BedrockModel:
+    """역할 설정으로 BedrockModel 생성 (인자별 캐싱)"""
     if role not in config.models:
         available = list(config.models.keys())
         raise ValueError(f"알 수 없는 역할: {role}. 사용 가능: {available}")
@@ -414,7 +456,7 @@ def get_agent(
         logger.info(f"[{agent_name.upper()}] 프롬프트 캐시 활성화 (type={cache_type})")
         system_prompt_content = [
             SystemContentBlock(text=system_prompt),
-            SystemContentBlock(cachePoint={"type": cache_type})
+            _get_cache_point(cache_type)
         ]
     else:
         logger.info(f"[{agent_name.upper()}] 프롬프트 캐시 비활성화")
@@ -460,7 +502,7 @@ def create_system_prompt_with_cache(
     """
     return [
         SystemContentBlock(text=system_prompt),
-        SystemContentBlock(cachePoint={"type": cache_type})
+        _get_cache_point(cache_type)
     ]
 
 
@@ -513,22 +555,30 @@ async def _retry_agent_streaming(
     agent: Agent,
     message: str,
     max_attempts: int = 5,
-    base_delay: int = 10
+    base_delay: int = 10,
+    max_delay: int = 120,
+    max_total_tokens: Optional[int] = None
 ):
     """
     스로틀링 재시도 로직이 있는 에이전트 스트리밍.
 
     sample-deep-insight/self-hosted의 프로덕션 검증 패턴.
+    대기 시간은 decorrelated jitter 백오프(min(max_delay, uniform(base, 이전 대기 × 3)))로
+    계산하여 동시 요청이 같은 시점에 재시도하지 않도록 합니다.
 
     Args:
         agent: Strands 에이전트 인스턴스
         message: 에이전트에 보낼 메시지
         max_attempts: 최대 재시도 횟수
-        base_delay: 지수 백오프를 위한 기본 지연 시간(초)
+        base_delay: 백오프 기본 지연 시간(초)
+        max_delay: 백오프 최대 지연 시간(초)
+        max_total_tokens: 에이전트 누적 토큰이 이 값을 넘으면 재시도하지 않음 (None이면 제한 없음)
 
     Yields:
         원시 에이전트 스트리밍 이벤트
     """
+    delay = base_delay
+
     for attempt in range(max_attempts):
         try:
             agent_stream = agent.stream_async(message)
@@ -548,24 +598,31 @@ async def _retry_agent_streaming(
                 error_code = e.response.get('Error', {}).get('Code', '')
                 is_throttling = error_code == 'ThrottlingException'
 
-            # 스로틀링 오류에 대해 재시도
-            if is_throttling and attempt < max_attempts - 1:
-                delay = base_delay * (2 ** attempt)  # 지수 백오프
-                logger.info(f"스로틀링 감지 - 재시도 {attempt + 1}/{max_attempts}, {delay}초 대기 중...")
-                await asyncio.sleep(delay)
-                continue
-            else:
-                if attempt == max_attempts - 1:
-                    logger.error(f"스트리밍 오류 (시도 {attempt + 1}/{max_attempts}): {e}")
-                    logger.error(traceback.format_exc())
+            if attempt == max_attempts - 1:
+                logger.error(f"스트리밍 오류 (시도 {attempt + 1}/{max_attempts}): {e}")
+                import traceback  # 오류 경로에서만 필요
+                logger.error(traceback.format_exc())
+                raise
+
+            # 토큰 예산 초과 시 재시도 중단 (같은 크기의 요청은 다시 실패할 가능성이 높음)
+            if max_total_tokens is not None:
+                used_tokens = _read_usage(agent).total
+                if used_tokens > max_total_tokens:
+                    logger.error(
+                        f"토큰 예산 초과로 재시도 중단: {used_tokens:,} > {max_total_tokens:,}"
+                    )
                     raise
-                else:
-                    delay = base_delay * (2 ** attempt)
-                    await asyncio.sleep(delay)
-                    continue
+
+            # decorrelated jitter 백오프
+            delay = min(max_delay, random.uniform(base_delay, delay * 3))
+            if is_throttling:
+                logger.info(f"스로틀링 감지 - 재시도 {attempt + 1}/{max_attempts}, {delay:.1f}초 대기 중...")
+            await asyncio.sleep(delay)
+            continue
 
         except Exception as e:
             logger.error(f"스트리밍 중 예상치 못한 오류: {e}")
+            import traceback  # 오류 경로에서만 필요
             logger.error(traceback.format_exc())
             raise
 
@@ -574,6 +631,90 @@ async def _retry_agent_streaming(
 # 에이전트 실행 헬퍼
 # =============================================================================
 
+class _AgentUsage(TypedDict):
+    """token_usage['by_agent'] 항목 구조."""
+    input: int
+    output: int
+    cache_read: int
+    cache_write: int
+    model_id: str
+
+
+class _TokenUsage(TypedDict):
+    """shared_state['token_usage'] 구조 (TokenTracker가 관리)."""
+    total_input_tokens: int
+    total_output_tokens: int
+    total_tokens: int
+    cache_read_input_tokens: int
+    cache_write_input_tokens: int
+    cache_hit_ratio: float
+    by_agent: Dict[str, _AgentUsage]
+
+
+@dataclass(slots=True)
+class _UsageDelta:
+    """에이전트 호출 1회분 토큰 사용량 (누적 경로용 내부 표현)."""
+    input: int = 0
+    output: int = 0
+    total: int = 0
+    cache_read: int = 0
+    cache_write: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """extract_usage_from_agent 호환 딕셔너리로 변환."""
+        return {
+            "input_tokens": self.input,
+            "output_tokens": self.output,
+            "total_tokens": self.total,
+            "cache_read_input_tokens": self.cache_read,
+            "cache_write_input_tokens": self.cache_write,
+        }
+
+
+def _read_usage(agent: Agent) -> _UsageDelta:
+    """에이전트의 이벤트 루프 메트릭에서 _UsageDelta 추출."""
+    # 실행 후 에이전트에는 거의 항상 메트릭이 있으므로 hasattr 검사 대신 EAFP
+    try:
+        accumulated = agent.event_loop_metrics.accumulated_usage
+        get = accumulated.get
+        input_tokens = get("inputTokens", 0)
+        output_tokens = get("outputTokens", 0)
+        cache_read = get("cacheReadInputTokens", 0)
+        cache_write = get("cacheWriteInputTokens", 0)
+    except AttributeError:
+        return _UsageDelta()
+    except Exception as e:
+        logger.warning(f"사용량 추출 실패: {e}")
+        return _UsageDelta()
+
+    # 제공자에 따라 inputTokens가 캐시 토큰을 제외하므로 보고된 totalTokens 대신
+    # 구성 요소 합계를 총 토큰으로 사용 (불일치는 DEBUG로만 기록)
+    total = input_tokens + output_tokens + cache_read + cache_write
+    reported_total = get("totalTokens", 0)
+    if reported_total and abs(total - reported_total) > 1:
+        logger.debug(f"total_tokens 불일치: 보고={reported_total} 계산={total}")
+
+    return _UsageDelta(input_tokens, output_tokens, total, cache_read, cache_write)
+
+
+def _agent_model_id(agent: Agent) -> str:
+    """에이전트의 model_id 반환 (에이전트 인스턴스에 캐싱하여 호출마다 속성 체인을 다시 따라가지 않음)."""
+    model_id = getattr(agent, "_cached_model_id", None)
+    if model_id is not None:
+        return model_id
+
+    try:
+        model_id = agent.model.config.get('model_id', 'unknown')
+    except AttributeError:
+        model_id = 'unknown'
+
+    try:
+        agent._cached_model_id = model_id
+    except AttributeError:
+        pass  # 속성 설정이 불가능한 객체 (__slots__ 등)
+    return model_id
+
+
 def extract_usage_from_agent(agent: Agent) -> Dict[str, int]:
     """
     에이전트의 이벤트 루프 메트릭에서 토큰 사용량 추출.
@@ -587,32 +728,11 @@ def extract_usage_from_agent(agent: Agent) -> Dict[str, int]:
         토큰 사용량 딕셔너리:
         - input_tokens: 일반 입력 토큰
         - output_tokens: 출력 토큰
-        - total_tokens: 총 토큰
+        - total_tokens: 총 토큰 (입력 + 출력 + 캐시 읽기 + 캐시 쓰기)
         - cache_read_input_tokens: 읽은 캐시 토큰 (90% 할인)
         - cache_write_input_tokens: 캐시에 쓴 토큰 (25% 추가)
     """
-    usage = {
-        "input_tokens": 0,
-        "output_tokens": 0,
-        "total_tokens": 0,
-        "cache_read_input_tokens": 0,
-        "cache_write_input_tokens": 0
-    }
-
-    try:
-        if hasattr(agent, 'event_loop_metrics'):
-            metrics = agent.event_loop_metrics
-            if hasattr(metrics, 'accumulated_usage'):
-                accumulated = metrics.accumulated_usage
-                usage["input_tokens"] = accumulated.get("inputTokens", 0)
-                usage["output_tokens"] = accumulated.get("outputTokens", 0)
-                usage["total_tokens"] = accumulated.get("totalTokens", 0)
-                usage["cache_read_input_tokens"] = accumulated.get("cacheReadInputTokens", 0)
-                usage["cache_write_input_tokens"] = accumulated.get("cacheWriteInputTokens", 0)
-    except Exception as e:
-        logger.warning(f"사용량 추출 실패: {e}")
-
-    return usage
+    return _read_usage(agent).to_dict()
 
 
 async def run_agent_async(
@@ -641,21 +761,25 @@ async def run_agent_async(
         print(result["text"])
         print(result["usage"])
     """
-    response_text = ""
+    chunks: List[str] = []
 
     if use_retry:
-        async for event in _retry_agent_streaming(agent, message):
-            if collect_response and "data" in event:
-                response_text += event["data"]
+        agent_stream = _retry_agent_streaming(
+            agent,
+            message,
+            max_total_tokens=get_config().max_retry_total_tokens
+        )
     else:
-        async for event in agent.stream_async(message):
-            if collect_response and "data" in event:
-                response_text += event["data"]
+        agent_stream = agent.stream_async(message)
+
+    async for event in agent_stream:
+        if collect_response and "data" in event:
+            chunks.append(event["data"])
 
     usage = extract_usage_from_agent(agent)
 
     return {
-        "text": response_text,
+        "text": "".join(chunks),
         "usage": usage
     }
 
@@ -714,14 +838,20 @@ def parse_response_text(response) -> Dict[str, str]:
         - signature: 추론 서명 (있는 경우)
     """
     output = {}
+    text = ""
 
-    if len(response.message["content"]) == 2:  # 추론 있음
-        reasoning_content = response.message["content"][0].get("reasoningContent", {})
-        reasoning_text = reasoning_content.get("reasoningText", {})
-        output["reasoning"] = reasoning_text.get("text", "")
-        output["signature"] = reasoning_text.get("signature", "")
+    # 블록 개수에 의존하지 않고 한 번의 순회로 추론/텍스트 블록 식별
+    # (도구 호출 블록 등이 섞여 있어도 동작)
+    for block in response.message["content"]:
+        reasoning_content = block.get("reasoningContent")
+        if reasoning_content:
+            reasoning_text = reasoning_content.get("reasoningText", {})
+            output["reasoning"] = reasoning_text.get("text", "")
+            output["signature"] = reasoning_text.get("signature", "")
+        elif "text" in block:
+            text = block["text"]  # 마지막 텍스트 블록 사용
 
-    output["text"] = response.message["content"][-1].get("text", "")
+    output["text"] = text
 
     return output
 
@@ -730,6 +860,30 @@ def parse_response_text(response) -> Dict[str, str]:
 # 토큰 추적 (프로덕션 검증 패턴)
 # =============================================================================
 
+# 터미널이 아닌 출력(파일 리다이렉트, CI 로그, 노트북)에서는 ANSI 색상 코드 생략
+_ANSI = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
+
+# print_summary 출력 템플릿 (형식 문자열을 모듈 로드 시 한 번만 정의하고 bound format 사용)
+# 토큰 순서: 일반 입력, 캐시 읽기, 캐시 쓰기, 출력
+_TOTAL_BREAKDOWN = (
+    "  - 일반 입력:    {0:>8,} (100% 비용)\n"
+    "  - 캐시 읽기:    {1:>8,} (10% 비용 - 90% 할인)\n"
+    "  - 캐시 쓰기:    {2:>8,} (125% 비용 - 25% 추가)\n"
+    "  - 출력:         {3:>8,}"
+).format
+_DETAIL_BREAKDOWN = (
+    "    - 일반 입력:    {0:>8,} (100% 비용)\n"
+    "    - 캐시 읽기:    {1:>8,} (10% 비용 - 90% 할인)\n"
+    "    - 캐시 쓰기:    {2:>8,} (125% 비용 - 25% 추가)\n"
+    "    - 출력:         {3:>8,}"
+).format
+_MODEL_HEADER = "\n  [{0}]\n    총: {1:,}".format
+_AGENT_HEADER = "\n  [{0}] 총: {1:,}\n    모델: {2}".format
+
+# TOKEN_SUMMARY_VERBOSE=0이면 print_summary에서 모델/에이전트별 상세 내역 생략
+_SUMMARY_VERBOSE = os.getenv("TOKEN_SUMMARY_VERBOSE", "1") != "0"
+
+
 class TokenTracker:
     """
     에이전트 간 토큰 사용량 추적 및 보고를 위한 헬퍼 클래스.
@@ -747,28 +901,20 @@ class TokenTracker:
         TokenTracker.initialize(shared_state)
 
         # 각 에이전트 호출 후
-        usage = extract_usage_from_agent(agent)
-        event = {
-            "event_type": "usage_metadata",
-            "agent_name": "translator",
-            "model_id": "claude-opus-4-5",
-            "input_tokens": usage["input_tokens"],
-            "output_tokens": usage["output_tokens"],
-            "total_tokens": usage["total_tokens"],
-            "cache_read_input_tokens": usage["cache_read_input_tokens"],
-            "cache_write_input_tokens": usage["cache_write_input_tokens"],
-        }
+        TokenTracker.accumulate_from_agent(agent, "translator", shared_state)
+
+        # 외부 이벤트 스트림의 경우
         TokenTracker.accumulate(event, shared_state)
 
         # 워크플로우 종료 시
         TokenTracker.print_summary(shared_state)
     """
 
-    # 터미널 출력용 ANSI 색상 코드
-    CYAN = '\033[96m'
-    YELLOW = '\033[93m'
-    GREEN = '\033[92m'
-    END = '\033[0m'
+    # 터미널 출력용 ANSI 색상 코드 (TTY가 아니면 빈 문자열)
+    CYAN = '\033[96m' if _ANSI else ''
+    YELLOW = '\033[93m' if _ANSI else ''
+    GREEN = '\033[92m' if _ANSI else ''
+    END = '\033[0m' if _ANSI else ''
 
     @staticmethod
     def initialize(shared_state: Dict[str, Any]) -> None:
@@ -780,47 +926,142 @@ class TokenTracker:
                 'total_tokens': 0,
                 'cache_read_input_tokens': 0,   # 캐시 히트 (90% 할인)
                 'cache_write_input_tokens': 0,  # 캐시 생성 (25% 추가 비용)
+                'cache_hit_ratio': 0.0,         # 누적 시 갱신 (읽기 O(1))
                 'by_agent': {}
             }
 
     @staticmethod
     def accumulate(event: Dict[str, Any], shared_state: Dict[str, Any]) -> None:
-        """메타데이터 이벤트의 토큰 사용량을 공유 상태에 누적."""
-        if event.get("event_type") == "usage_metadata":
-            TokenTracker.initialize(shared_state)
-            usage = shared_state['token_usage']
-
-            input_tokens = event.get('input_tokens', 0)
-            output_tokens = event.get('output_tokens', 0)
-            total_tokens = event.get('total_tokens', 0)
-            cache_read = event.get('cache_read_input_tokens', 0)
-            cache_write = event.get('cache_write_input_tokens', 0)
-
-            # 총 토큰 누적
-            usage['total_input_tokens'] += input_tokens
-            usage['total_output_tokens'] += output_tokens
-            usage['total_tokens'] += total_tokens
-            usage['cache_read_input_tokens'] += cache_read
-            usage['cache_write_input_tokens'] += cache_write
-
-            # model_id와 함께 에이전트별 추적
-            agent_name = event.get('agent_name')
-            model_id = event.get('model_id', 'unknown')
+        """메타데이터 이벤트의 토큰 사용량을 공유 상태에 누적 (외부 이벤트 스트림용 어댑터)."""
+        get = event.get
+        if get("event_type") == "usage_metadata":
+            delta = _UsageDelta(
+                input=get('input_tokens', 0),
+                output=get('output_tokens', 0),
+                total=get('total_tokens', 0),
+                cache_read=get('cache_read_input_tokens', 0),
+                cache_write=get('cache_write_input_tokens', 0),
+            )
+            TokenTracker._apply_delta(
+                get('agent_name'),
+                get('model_id', 'unknown'),
+                delta,
+                shared_state
+            )
+
+    @staticmethod
+    def _apply_delta(
+        agent_name: Optional[str],
+        model_id: str,
+        delta: _UsageDelta,
+        shared_state: Dict[str, Any]
+    ) -> None:
+        """_UsageDelta를 공유 상태 카운터에 직접 누적."""
+        TokenTracker.initialize(shared_state)
+        usage: _TokenUsage = shared_state['token_usage']
+
+        # 총 토큰 누적
+        usage['total_input_tokens'] += delta.input
+        usage['total_output_tokens'] += delta.output
+        usage['total_tokens'] += delta.total
+        usage['cache_read_input_tokens'] += delta.cache_read
+        usage['cache_write_input_tokens'] += delta.cache_write
+
+        # 캐시 히트율을 누적 시점에 갱신 (읽기 측은 나눗셈 없이 조회만)
+        if delta.cache_read or delta.cache_write:
+            cache_read = usage['cache_read_input_tokens']
+            total_cache = cache_read + usage['cache_write_input_tokens']
+            usage['cache_hit_ratio'] = cache_read / total_cache if total_cache else 0.0
+
+        # model_id와 함께 에이전트별 추적
+        if agent_name:
+            by_agent = usage['by_agent']
+            agent_usage = by_agent.get(agent_name)
+            if agent_usage is None:
+                agent_usage = by_agent[agent_name] = {
+                    'input': 0,
+                    'output': 0,
+                    'cache_read': 0,
+                    'cache_write': 0,
+                    'model_id': model_id
+                }
+            agent_usage['input'] += delta.input
+            agent_usage['output'] += delta.output
+            agent_usage['cache_read'] += delta.cache_read
+            agent_usage['cache_write'] += delta.cache_write
+            agent_usage['model_id'] = model_id
+
+    @staticmethod
+    def accumulate_many(events: Iterable[Dict[str, Any]], shared_state: Dict[str, Any]) -> None:
+        """
+        여러 메타데이터 이벤트를 한 번에 누적.
 
+        이벤트별 합계를 로컬 변수/딕셔너리에 모은 뒤 공유 상태에는
+        에이전트당 한 번만 병합합니다. 결과는 accumulate()를 이벤트마다
+        호출한 것과 같습니다 (에이전트 model_id는 마지막 이벤트 기준).
+        """
+        total_input = total_output = total_tokens = 0
+        total_cache_read = total_cache_write = 0
+        agent_deltas: Dict[str, list] = {}
+
+        for event in events:
+            get = event.get
+            if get("event_type") != "usage_metadata":
+                continue
+            input_tokens = get('input_tokens', 0)
+            output_tokens = get('output_tokens', 0)
+            cache_read = get('cache_read_input_tokens', 0)
+            cache_write = get('cache_write_input_tokens', 0)
+
+            total_input += input_tokens
+            total_output += output_tokens
+            total_tokens += get('total_tokens', 0)
+            total_cache_read += cache_read
+            total_cache_write += cache_write
+
+            agent_name = get('agent_name')
             if agent_name:
-                if agent_name not in usage['by_agent']:
-                    usage['by_agent'][agent_name] = {
-                        'input': 0,
-                        'output': 0,
-                        'cache_read': 0,
-                        'cache_write': 0,
-                        'model_id': model_id
-                    }
-                usage['by_agent'][agent_name]['input'] += input_tokens
-                usage['by_agent'][agent_name]['output'] += output_tokens
-                usage['by_agent'][agent_name]['cache_read'] += cache_read
-                usage['by_agent'][agent_name]['cache_write'] += cache_write
-                usage['by_agent'][agent_name]['model_id'] = model_id
+                model_id = get('model_id', 'unknown')
+                delta = agent_deltas.get(agent_name)
+                if delta is None:
+                    agent_deltas[agent_name] = [input_tokens, output_tokens, cache_read, cache_write, model_id]
+                else:
+                    delta[0] += input_tokens
+                    delta[1] += output_tokens
+                    delta[2] += cache_read
+                    delta[3] += cache_write
+                    delta[4] = model_id
+
+        TokenTracker.initialize(shared_state)
+        usage: _TokenUsage = shared_state['token_usage']
+        usage['total_input_tokens'] += total_input
+        usage['total_output_tokens'] += total_output
+        usage['total_tokens'] += total_tokens
+        usage['cache_read_input_tokens'] += total_cache_read
+        usage['cache_write_input_tokens'] += total_cache_write
+
+        if total_cache_read or total_cache_write:
+            cache_read = usage['cache_read_input_tokens']
+            total_cache = cache_read + usage['cache_write_input_tokens']
+            usage['cache_hit_ratio'] = cache_read / total_cache if total_cache else 0.0
+
+        by_agent = usage['by_agent']
+        for agent_name, (input_tokens, output_tokens, cache_read, cache_write, model_id) in agent_deltas.items():
+            agent_usage = by_agent.get(agent_name)
+            if agent_usage is None:
+                by_agent[agent_name] = {
+                    'input': input_tokens,
+                    'output': output_tokens,
+                    'cache_read': cache_read,
+                    'cache_write': cache_write,
+                    'model_id': model_id
+                }
+            else:
+                agent_usage['input'] += input_tokens
+                agent_usage['output'] += output_tokens
+                agent_usage['cache_read'] += cache_read
+                agent_usage['cache_write'] += cache_write
+                agent_usage['model_id'] = model_id
 
     @staticmethod
     def accumulate_from_agent(
@@ -836,20 +1077,7 @@ class TokenTracker:
             agent_name: 추적용 에이전트 이름
             shared_state: 공유 상태 딕셔너리
         """
-        usage = extract_usage_from_agent(agent)
-        model_id = agent.model.config.get('model_id', 'unknown') if hasattr(agent, 'model') else 'unknown'
-
-        event = {
-            "event_type": "usage_metadata",
-            "agent_name": agent_name,
-            "model_id": model_id,
-            "input_tokens": usage["input_tokens"],
-            "output_tokens": usage["output_tokens"],
-            "total_tokens": usage["total_tokens"],
-            "cache_read_input_tokens": usage["cache_read_input_tokens"],
-            "cache_write_input_tokens": usage["cache_write_input_tokens"],
-        }
-        TokenTracker.accumulate(event, shared_state)
+        TokenTracker._apply_delta(agent_name, _agent_model_id(agent), _read_usage(agent), shared_state)
 
     @staticmethod
     def get_usage(shared_state: Dict[str, Any]) -> Dict[str, Any]:
@@ -870,32 +1098,26 @@ class TokenTracker:
             캐시 히트 비율을 나타내는 0~1 사이의 Float.
             높을수록 좋음 (더 많은 캐시 히트 = 더 많은 절감).
         """
-        usage = shared_state.get('token_usage', {})
-        cache_read = usage.get('cache_read_input_tokens', 0)
-        cache_write = usage.get('cache_write_input_tokens', 0)
-        total_cache = cache_read + cache_write
-
-        if total_cache == 0:
-            return 0.0
-        return cache_read / total_cache
+        return shared_state.get('token_usage', {}).get('cache_hit_ratio', 0.0)
 
     @staticmethod
     def print_current(shared_state: Dict[str, Any]) -> None:
         """모델 정보와 함께 현재 누적 토큰 사용량 출력."""
         token_usage = shared_state.get('token_usage', {})
-        if token_usage and token_usage.get('total_tokens', 0) > 0:
-            total_input = token_usage.get('total_input_tokens', 0)
-            total_output = token_usage.get('total_output_tokens', 0)
-            total = token_usage.get('total_tokens', 0)
-            cache_read = token_usage.get('cache_read_input_tokens', 0)
-            cache_write = token_usage.get('cache_write_input_tokens', 0)
+        get = token_usage.get
+        total = get('total_tokens', 0)
+        if total > 0:
+            total_input = get('total_input_tokens', 0)
+            total_output = get('total_output_tokens', 0)
+            cache_read = get('cache_read_input_tokens', 0)
+            cache_write = get('cache_write_input_tokens', 0)
 
             # 사용된 고유 모델 가져오기
-            by_agent = token_usage.get('by_agent', {})
-            models_used = set()
-            for agent_data in by_agent.values():
-                if 'model_id' in agent_data:
-                    models_used.add(agent_data['model_id'])
+            models_used = {
+                agent_data['model_id']
+                for agent_data in get('by_agent', {}).values()
+                if 'model_id' in agent_data
+            }
 
             print(f"{TokenTracker.CYAN}>>> 누적 토큰 (총: {total:,}):{TokenTracker.END}")
             if models_used:
@@ -903,119 +1125,136 @@ class TokenTracker:
             print(f"{TokenTracker.CYAN}    일반 입력: {total_input:,} | 캐시 읽기: {cache_read:,} (90% 할인) | 캐시 쓰기: {cache_write:,} (25% 추가) | 출력: {total_output:,}{TokenTracker.END}")
 
     @staticmethod
-    def print_summary(shared_state: Dict[str, Any]) -> None:
-        """모델 및 에이전트 분석이 포함된 상세 토큰 사용량 요약 출력."""
+    def print_summary(shared_state: Dict[str, Any], verbose: Optional[bool] = None) -> None:
+        """
+        모델 및 에이전트 분석이 포함된 상세 토큰 사용량 요약 출력.
+
+        Args:
+            shared_state: 공유 상태 딕셔너리
+            verbose: False면 총계만 출력 (기본값: TOKEN_SUMMARY_VERBOSE 환경 변수, 미설정 시 True)
+        """
+        if verbose is None:
+            verbose = _SUMMARY_VERBOSE
+
         print("\n" + "=" * 60)
         print("=== 토큰 사용량 요약 ===")
         print("=" * 60)
 
         token_usage = shared_state.get('token_usage', {})
+        get = token_usage.get
+        total = get('total_tokens', 0)
 
-        if not token_usage or token_usage.get('total_tokens', 0) == 0:
+        if total == 0:
             print("토큰 사용량 데이터 없음")
             print("=" * 60)
             return
 
-        total_input = token_usage.get('total_input_tokens', 0)
-        total_output = token_usage.get('total_output_tokens', 0)
-        total = token_usage.get('total_tokens', 0)
-        cache_read = token_usage.get('cache_read_input_tokens', 0)
-        cache_write = token_usage.get('cache_write_input_tokens', 0)
+        total_input = get('total_input_tokens', 0)
+        total_output = get('total_output_tokens', 0)
+        cache_read = get('cache_read_input_tokens', 0)
+        cache_write = get('cache_write_input_tokens', 0)
+
+        # 단일 패스로 에이전트별 값 추출 + 모델별 토큰 집계
+        by_agent = get('by_agent', {})
+        agent_rows = []
+        model_usage = {}
+        for agent_name, usage in by_agent.items():
+            get = usage.get
+            model_id = get('model_id', 'unknown')
+            input_tokens = get('input', 0)
+            output_tokens = get('output', 0)
+            agent_cache_read = get('cache_read', 0)
+            agent_cache_write = get('cache_write', 0)
+            agent_rows.append((
+                agent_name, model_id,
+                input_tokens, output_tokens, agent_cache_read, agent_cache_write
+            ))
+
+            bucket = model_usage.get(model_id)
+            if bucket is None:
+                bucket = model_usage[model_id] = {
+                    'input': 0,
+                    'output': 0,
+                    'cache_read': 0,
+                    'cache_write': 0,
+                    'agents': []
+                }
+            bucket['input'] += input_tokens
+            bucket['output'] += output_tokens
+            bucket['cache_read'] += agent_cache_read
+            bucket['cache_write'] += agent_cache_write
+            bucket['agents'].append(agent_name)
 
-        # 사용된 고유 모델 가져오기
-        by_agent = token_usage.get('by_agent', {})
-        models_used = set()
-        for agent_data in by_agent.values():
-            if 'model_id' in agent_data:
-                models_used.add(agent_data['model_id'])
+        models_used = sorted(model_usage)
 
         print(f"\n총 토큰: {total:,}")
         if models_used:
-            print(f"사용된 모델: {', '.join(sorted(models_used))}")
-        print(f"  - 일반 입력:    {total_input:>8,} (100% 비용)")
-        print(f"  - 캐시 읽기:    {cache_read:>8,} (10% 비용 - 90% 할인)")
-        print(f"  - 캐시 쓰기:    {cache_write:>8,} (125% 비용 - 25% 추가)")
-        print(f"  - 출력:         {total_output:>8,}")
+            print(f"사용된 모델: {', '.join(models_used)}")
+        print(_TOTAL_BREAKDOWN(total_input, cache_read, cache_write, total_output))
 
         # 캐시 효율성
         cache_ratio = TokenTracker.get_cache_savings_ratio(shared_state)
         print(f"\n  캐시 히트율: {cache_ratio:.1%}")
 
         # 모델 사용량 요약
-        if by_agent:
+        if verbose and by_agent:
             print("\n" + "-" * 60)
             print("모델 사용량 요약 (비용 계산용):")
             print("-" * 60)
 
-            # 모델별 토큰 집계
-            model_usage = {}
-            for agent_name, usage in by_agent.items():
-                model_id = usage.get('model_id', 'unknown')
-                if model_id not in model_usage:
-                    model_usage[model_id] = {
-                        'input': 0,
-                        'output': 0,
-                        'cache_read': 0,
-                        'cache_write': 0,
-                        'agents': []
-                    }
-                model_usage[model_id]['input'] += usage.get('input', 0)
-                model_usage[model_id]['output'] += usage.get('output', 0)
-                model_usage[model_id]['cache_read'] += usage.get('cache_read', 0)
-                model_usage[model_id]['cache_write'] += usage.get('cache_write', 0)
-                model_usage[model_id]['agents'].append(agent_name)
-
-            for model_id in sorted(model_usage.keys()):
+            for model_id in models_used:
                 usage = model_usage[model_id]
-                model_total = usage['input'] + usage['output'] + usage['cache_read'] + usage['cache_write']
-                agents_str = ', '.join(usage['agents'])
+                m_input = usage['input']
+                m_output = usage['output']
+                m_cache_read = usage['cache_read']
+                m_cache_write = usage['cache_write']
 
-                print(f"\n  [{model_id}]")
-                print(f"    총: {model_total:,}")
-                print(f"    - 일반 입력:    {usage['input']:>8,} (100% 비용)")
-                print(f"    - 캐시 읽기:    {usage['cache_read']:>8,} (10% 비용 - 90% 할인)")
-                print(f"    - 캐시 쓰기:    {usage['cache_write']:>8,} (125% 비용 - 25% 추가)")
-                print(f"    - 출력:         {usage['output']:>8,}")
-                print(f"    사용 에이전트: {agents_str}")
+                print(_MODEL_HEADER(model_id, m_input + m_output + m_cache_read + m_cache_write))
+                print(_DETAIL_BREAKDOWN(m_input, m_cache_read, m_cache_write, m_output))
+                print("    사용 에이전트: " + ', '.join(usage['agents']))
 
             print("\n" + "-" * 60)
             print("에이전트별 토큰 사용량:")
             print("-" * 60)
 
-            for agent_name in sorted(by_agent.keys()):
-                usage = by_agent[agent_name]
-                input_tokens = usage.get('input', 0)
-                output_tokens = usage.get('output', 0)
-                agent_cache_read = usage.get('cache_read', 0)
-                agent_cache_write = usage.get('cache_write', 0)
+            agent_rows.sort()
+            for (agent_name, model_id,
+                 input_tokens, output_tokens, agent_cache_read, agent_cache_write) in agent_rows:
                 agent_total = input_tokens + output_tokens + agent_cache_read + agent_cache_write
-                model_id = usage.get('model_id', 'unknown')
 
-                print(f"\n  [{agent_name}] 총: {agent_total:,}")
-                print(f"    모델: {model_id}")
-                print(f"    - 일반 입력:    {input_tokens:>8,} (100% 비용)")
-                print(f"    - 캐시 읽기:    {agent_cache_read:>8,} (10% 비용 - 90% 할인)")
-                print(f"    - 캐시 쓰기:    {agent_cache_write:>8,} (125% 비용 - 25% 추가)")
-                print(f"    - 출력:         {output_tokens:>8,}")
+                print(_AGENT_HEADER(agent_name, agent_total, model_id))
+                print(_DETAIL_BREAKDOWN(input_tokens, agent_cache_read, agent_cache_write, output_tokens))
 
         print("=" * 60)
 
+    @staticmethod
+    def view(shared_state: Dict[str, Any]) -> Mapping[str, Any]:
+        """
+        토큰 사용량의 읽기 전용 뷰 (복사 없음).
+
+        최상위 키만 읽기 전용이며 by_agent 내부 딕셔너리는 원본을 가리킵니다.
+        JSON 직렬화나 보관용 사본이 필요하면 to_dict()를 사용하세요.
+        """
+        return MappingProxyType(shared_state.get('token_usage', {}))
+
     @staticmethod
     def to_dict(shared_state: Dict[str, Any]) -> Dict[str, Any]:
         """
-        JSON 직렬화를 위해 토큰 사용량을 딕셔너리로 내보내기.
+        JSON 직렬화를 위해 토큰 사용량을 딕셔너리로 내보내기 (스냅샷).
 
         TranslationRecord 메타데이터에 저장할 때 유용.
+        by_agent는 복사되므로 반환값을 수정해도 추적 상태에 영향이 없습니다.
         """
         usage = shared_state.get('token_usage', {})
+        get = usage.get
         return {
-            'total_input_tokens': usage.get('total_input_tokens', 0),
-            'total_output_tokens': usage.get('total_output_tokens', 0),
-            'total_tokens': usage.get('total_tokens', 0),
-            'cache_read_input_tokens': usage.get('cache_read_input_tokens', 0),
-            'cache_write_input_tokens': usage.get('cache_write_input_tokens', 0),
-            'cache_hit_ratio': TokenTracker.get_cache_savings_ratio(shared_state),
-            'by_agent': usage.get('by_agent', {})
+            'total_input_tokens': get('total_input_tokens', 0),
+            'total_output_tokens': get('total_output_tokens', 0),
+            'total_tokens': get('total_tokens', 0),
+            'cache_read_input_tokens': get('cache_read_input_tokens', 0),
+            'cache_write_input_tokens': get('cache_write_input_tokens', 0),
+            'cache_hit_ratio': get('cache_hit_ratio', 0.0),
+            'by_agent': {name: dict(data) for name, data in get('by_agent', {}).items()}
         }
 
 
@@ -8,7 +8,7 @@ Strands GraphBuilder에서 노드 간 데이터를 공유하기 위한 글로벌
 
 주요 기능:
 - 워크플로우 인스턴스별 격리된 상태 관리
-- 스레드 안전 접근
+- 스레드 안전 접근 (샤드별 락으로 워크플로우 간 경합 제거)
 - 기존 노드 코드와의 호환성 유지
 
 Example:
@@ -27,13 +27,18 @@ Example:
     state_manager.cleanup(workflow_id)
 """
 
-import uuid
+import os
+import time
+import itertools
 import threading
-from typing import Any, Dict, Optional
-from datetime import datetime
+import weakref
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from contextlib import contextmanager
 
+from src.models.gate_decision import Verdict
 from src.models.workflow_state import WorkflowState
 
 
@@ -41,17 +46,44 @@ from src.models.workflow_state import WorkflowState
 # 글로벌 상태 저장소
 # =============================================================================
 
-# 워크플로우 ID → 상태 매핑
-_workflow_states: Dict[str, Dict[str, Any]] = {}
-_states_lock = threading.Lock()
+# 워크플로우 ID → 상태 매핑 (샤드별 락)
+# 단일 글로벌 락 대신 N개 샤드로 나눠 독립 워크플로우끼리 경합하지 않도록 함
+_NUM_SHARDS = 16
+_SHARD_MASK = _NUM_SHARDS - 1
+_shards: List[Tuple[threading.Lock, Dict[str, Dict[str, Any]]]] = [
+    (threading.Lock(), {}) for _ in range(_NUM_SHARDS)
+]
+
+# 현재 활성 워크플로우 ID (태스크/스레드 컨텍스트별로 격리)
+# 동시 create_workflow 호출이 서로의 현재 ID를 덮어쓰지 않음
+_current_workflow_id: ContextVar[Optional[str]] = ContextVar(
+    "current_workflow_id", default=None
+)
+
+
+# 워크플로우 ID 생성용 프로세스 로컬 카운터 (상태 저장소가 프로세스 내부이므로 UUID 불필요)
+_workflow_counter = itertools.count(1)
+_pid = os.getpid()
+
 
-# 현재 활성 워크플로우 ID (단일 워크플로우 실행 시 편의용)
-_current_workflow_id: Optional[str] = None
+def _reset_workflow_ids_after_fork() -> None:
+    """fork된 자식 프로세스에서 PID와 카운터 재설정."""
+    global _workflow_counter, _pid
+    _workflow_counter = itertools.count(1)
+    _pid = os.getpid()
 
 
-@dataclass
+os.register_at_fork(after_in_child=_reset_workflow_ids_after_fork)
+
+
+def _shard(workflow_id: str) -> Tuple[threading.Lock, Dict[str, Dict[str, Any]]]:
+    """워크플로우 ID가 속한 샤드 (락, 딕셔너리) 반환."""
+    return _shards[hash(workflow_id) & _SHARD_MASK]
+
+
+@dataclass(slots=True, frozen=True)
 class WorkflowConfig:
-    """워크플로우 설정 (GraphBuilder용)"""
+    """워크플로우 설정 (GraphBuilder용, 불변)"""
     max_regenerations: int = 1
     num_candidates: int = 1
     enable_backtranslation: bool = True
@@ -82,7 +114,9 @@ class WorkflowStateManager:
     def create_workflow(
         self,
         unit: Any,
-        config: Optional[WorkflowConfig] = None
+        config: Optional[WorkflowConfig] = None,
+        *,
+        weak_unit: bool = False
     ) -> str:
         """
         새 워크플로우 상태 생성.
@@ -90,15 +124,21 @@ class WorkflowStateManager:
         Args:
             unit: TranslationUnit 인스턴스
             config: 워크플로우 설정
+            weak_unit: True면 unit을 약한 참조로 저장 (호출자가 unit을 계속 보유하는 경우,
+                상태가 unit 수명을 늘리지 않도록 함). 약한 참조를 지원하지 않는 객체는 강한 참조로 저장
 
         Returns:
             워크플로우 ID
         """
-        global _current_workflow_id
-
-        workflow_id = str(uuid.uuid4())
+        workflow_id = f"{_pid}-{next(_workflow_counter):x}"
         config = config or WorkflowConfig()
 
+        if weak_unit:
+            try:
+                unit = weakref.ref(unit)
+            except TypeError:
+                pass
+
         initial_state = {
             "workflow_id": workflow_id,
             "unit": unit,
@@ -106,7 +146,9 @@ class WorkflowStateManager:
             "num_candidates": config.num_candidates,
             "max_regenerations": config.max_regenerations,
             "workflow_state": WorkflowState.INITIALIZED,
-            "created_at": datetime.now(),
+            # 경과 시간 계산용 monotonic 시각 (벽시계 시각은 get_created_at()에서 지연 계산)
+            "created_at_ns": time.monotonic_ns(),
+            "created_at": None,
             # 토큰 추적용
             "token_usage": {
                 "total_input_tokens": 0,
@@ -114,13 +156,15 @@ class WorkflowStateManager:
                 "total_tokens": 0,
                 "cache_read_input_tokens": 0,
                 "cache_write_input_tokens": 0,
+                "cache_hit_ratio": 0.0,
                 "by_agent": {}
             }
         }
 
-        with _states_lock:
-            _workflow_states[workflow_id] = initial_state
-            _current_workflow_id = workflow_id
+        lock, states = _shard(workflow_id)
+        with lock:
+            states[workflow_id] = initial_state
+        _current_workflow_id.set(workflow_id)
 
         return workflow_id
 
@@ -137,15 +181,17 @@ class WorkflowStateManager:
         Raises:
             ValueError: 워크플로우를 찾을 수 없는 경우
         """
-        wf_id = workflow_id or _current_workflow_id
+        wf_id = workflow_id or _current_workflow_id.get()
 
         if not wf_id:
             raise ValueError("활성 워크플로우가 없습니다. create_workflow()를 먼저 호출하세요.")
 
-        with _states_lock:
-            if wf_id not in _workflow_states:
-                raise ValueError(f"워크플로우를 찾을 수 없음: {wf_id}")
-            return _workflow_states[wf_id]
+        lock, states = _shard(wf_id)
+        with lock:
+            state = states.get(wf_id)
+        if state is None:
+            raise ValueError(f"워크플로우를 찾을 수 없음: {wf_id}")
+        return state
 
     def update_state(
         self,
@@ -162,38 +208,77 @@ class WorkflowStateManager:
         state = self.get_state(workflow_id)
         state.update(updates)
 
-    def cleanup(self, workflow_id: Optional[str] = None) -> Dict[str, Any]:
+    def cleanup(
+        self,
+        workflow_id: Optional[str] = None,
+        *,
+        return_state: bool = True
+    ) -> Optional[Dict[str, Any]]:
         """
         워크플로우 상태 정리 및 반환.
 
         Args:
             workflow_id: 워크플로우 ID (없으면 현재 활성 워크플로우)
+            return_state: False면 상태를 반환하지 않고 삭제만 함 (참조를 바로 해제)
 
         Returns:
-            정리된 최종 상태
+            정리된 최종 상태 (return_state=False면 None)
         """
-        global _current_workflow_id
-
-        wf_id = workflow_id or _current_workflow_id
+        wf_id = workflow_id or _current_workflow_id.get()
 
         if not wf_id:
-            return {}
-
-        with _states_lock:
-            final_state = _workflow_states.pop(wf_id, {})
-            if _current_workflow_id == wf_id:
-                _current_workflow_id = None
+            return {} if return_state else None
+
+        final_state = None
+        lock, states = _shard(wf_id)
+        with lock:
+            if return_state:
+                final_state = states.pop(wf_id, {})
+            else:
+                states.pop(wf_id, None)
+
+        # 반환되는 최종 상태에는 항상 실제 unit 객체를 담음
+        if final_state and isinstance(final_state.get("unit"), weakref.ref):
+            final_state["unit"] = final_state["unit"]()
+        if _current_workflow_id.get() == wf_id:
+            _current_workflow_id.set(None)
 
         return final_state
 
+    def get_elapsed_ms(self, workflow_id: Optional[str] = None) -> int:
+        """
+        워크플로우 생성 후 경과 시간(밀리초).
+
+        monotonic 시계 기반이므로 시스템 시계 조정의 영향을 받지 않습니다.
+        """
+        state = self.get_state(workflow_id)
+        return (time.monotonic_ns() - state["created_at_ns"]) // 1_000_000
+
+    def get_created_at(self, workflow_id: Optional[str] = None) -> datetime:
+        """
+        워크플로우 생성 시각(벽시계).
+
+        최초 호출 시 monotonic 경과 시간으로 역산하여 상태에 캐싱합니다.
+        """
+        state = self.get_state(workflow_id)
+        created_at = state["created_at"]
+        if created_at is None:
+            elapsed_ns = time.monotonic_ns() - state["created_at_ns"]
+            created_at = datetime.now() - timedelta(microseconds=elapsed_ns // 1000)
+            state["created_at"] = created_at
+        return created_at
+
     def get_current_workflow_id(self) -> Optional[str]:
         """현재 활성 워크플로우 ID 반환."""
-        return _current_workflow_id
+        return _current_workflow_id.get()
 
     def list_workflows(self) -> list:
         """모든 활성 워크플로우 ID 목록 반환."""
-        with _states_lock:
-            return list(_workflow_states.keys())
+        workflow_ids = []
+        for lock, states in _shards:
+            with lock:
+                workflow_ids.extend(states)
+        return workflow_ids
 
 
 # 싱글톤 인스턴스
@@ -229,6 +314,31 @@ def get_workflow_state(workflow_id: Optional[str] = None) -> Dict[str, Any]:
     return get_state_manager().get_state(workflow_id)
 
 
+def workflow_elapsed_ms(workflow_id: Optional[str] = None) -> int:
+    """
+    현재 워크플로우 생성 후 경과 시간(밀리초).
+
+    Example:
+        logger.info(f"번역 완료 ({workflow_elapsed_ms()}ms 경과)")
+    """
+    return get_state_manager().get_elapsed_ms(workflow_id)
+
+
+def resolve_unit(state: Dict[str, Any]) -> Any:
+    """
+    상태에서 unit 객체 가져오기 (약한 참조로 저장된 경우 역참조).
+
+    Raises:
+        ValueError: 약한 참조로 저장된 unit이 이미 해제된 경우
+    """
+    unit = state["unit"]
+    if isinstance(unit, weakref.ref):
+        unit = unit()
+        if unit is None:
+            raise ValueError(f"워크플로우 unit이 이미 해제됨: {state.get('workflow_id')}")
+    return unit
+
+
 def update_workflow_state(
     updates: Dict[str, Any],
     workflow_id: Optional[str] = None
@@ -263,21 +373,22 @@ def workflow_context(unit: Any, config: Optional[WorkflowConfig] = None):
     try:
         yield workflow_id
     finally:
-        manager.cleanup(workflow_id)
+        manager.cleanup(workflow_id, return_state=False)
 
 
 # =============================================================================
 # 기존 코드 호환성 - 조건 함수용
 # =============================================================================
 
+# 최종화로 이어지는 판정 (조건 함수가 엣지마다 평가되므로 모듈 로드 시 한 번만 생성)
+_FINALIZE_VERDICTS = frozenset({Verdict.PASS, Verdict.BLOCK, Verdict.ESCALATE})
+
 def should_regenerate_from_state(workflow_id: Optional[str] = None) -> bool:
     """
     글로벌 상태에서 재생성 조건 확인.
 
     GraphBuilder 조건 함수에서 사용합니다.
     """
-    from src.models.gate_decision import Verdict
-
     try:
         state = get_workflow_state(workflow_id)
         decision = state.get("gate_decision")
@@ -292,14 +403,12 @@ def should_finalize_from_state(workflow_id: Optional[str] = None) -> bool:
 
     GraphBuilder 조건 함수에서 사용합니다.
     """
-    from src.models.gate_decision import Verdict
-
     try:
         state = get_workflow_state(workflow_id)
         decision = state.get("gate_decision")
         if not decision:
             return False
-        return decision.verdict in [Verdict.PASS, Verdict.BLOCK, Verdict.ESCALATE]
+        return decision.verdict in _FINALIZE_VERDICTS
     except ValueError:
         return False
 
@@ -324,6 +433,8 @@ __all__ = [
     # 편의 함수
     "get_workflow_state",
     "update_workflow_state",
+    "workflow_elapsed_ms",
+    "resolve_unit",
     "workflow_context",
     # 조건 함수
     "should_regenerate_from_state",
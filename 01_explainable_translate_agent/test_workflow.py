@@ -20,63 +20,118 @@ Strands GraphBuilder 기반 워크플로우 테스트
 # =============================================================================
 # 의존성
 # =============================================================================
+from __future__ import annotations
+
 import asyncio
 import argparse
 import json
 import logging
+import logging.config
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.models import TranslationUnit
-from src.graph.builder import TranslationWorkflowGraphV2, TranslationWorkflowConfig
-from src.utils.pricing import calculate_workflow_cost
-from src.utils.result_formatter import format_workflow_result
+# src 패키지(pydantic, strands, botocore 등)는 무거우므로 실제 사용하는 함수 안에서 임포트
+# (--help, --dry-run은 src를 전혀 임포트하지 않음)
+if TYPE_CHECKING:
+    from src.models import TranslationUnit
+    from src.graph.builder import TranslationWorkflowConfig
+
 
 # =============================================================================
 # OTEL 설정 (선택적)
 # =============================================================================
+def load_observability_session() -> Tuple[Callable[..., Any], bool]:
+    """observability_session과 OTEL 사용 가능 여부 반환 (미설치 시 대체 구현)"""
+    try:
+        from src.utils.strands_utils import observability_session
+        return observability_session, True
+    except ImportError:
+        from contextlib import contextmanager
+
+        @contextmanager
+        def observability_session(**kwargs):
+            yield {"session_id": kwargs.get("session_id") or "no-otel"}
+
+        return observability_session, False
+
+
+# uvloop은 선택 사항 (설치되어 있으면 libuv 기반 이벤트 루프로 실행)
 try:
-    from src.utils.strands_utils import observability_session
-    OTEL_AVAILABLE = True
-except ImportError:
-    OTEL_AVAILABLE = False
-    from contextlib import contextmanager
-    @contextmanager
-    def observability_session(**kwargs):
-        yield {"session_id": kwargs.get("session_id") or "no-otel"}
+    import uvloop
+    run_async = uvloop.run
+except (ImportError, AttributeError):  # uvloop.run은 0.18+
+    run_async = asyncio.run
 
 # =============================================================================
 # 설정
 # =============================================================================
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
+# 루트 핸들러와 로거 레벨을 한 번에 설정
+# 콘솔 핸들러는 동기식으로 유지 (결과 블록은 stdout에 바로 쓰므로
+# 백그라운드 스레드로 로그를 넘기면 헤더와 결과의 출력 순서가 뒤섞임)
+LOG_CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {"format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"},
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "default"},
+    },
+    "loggers": {
+        # 불필요한 로그 억제
+        "botocore": {"level": "WARNING"},
+        "urllib3": {"level": "WARNING"},
+        "src.utils.strands_utils": {"level": "WARNING"},
+        "strands.telemetry.metrics": {"level": "WARNING"},
+    },
+    "root": {"level": "INFO", "handlers": ["console"]},
+}
+
+# --debug 시 레벨만 덮어씀 (incremental: 핸들러는 그대로 유지)
+DEBUG_LOG_CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "incremental": True,
+    "loggers": {
+        "src.tools": {"level": "DEBUG"},
+        "src.graph": {"level": "DEBUG"},
+        # strands 내부 로그는 숨김
+        "strands": {"level": "WARNING"},
+    },
+}
+
+logging.config.dictConfig(LOG_CONFIG)
 
-# 불필요한 로그 억제
-logging.getLogger("botocore").setLevel(logging.WARNING)
-logging.getLogger("urllib3").setLevel(logging.WARNING)
-logging.getLogger("src.utils.strands_utils").setLevel(logging.WARNING)
-logging.getLogger("strands.telemetry.metrics").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
 
 RESULTS_DIR = Path(__file__).parent / "results"
 EXAMPLES_DIR = Path(__file__).parent / "examples"
 
+# 헤더 구분선
+_SEP = "=" * 60
+_SEP_NL = "\n" + _SEP
+
+# 워크플로우 설정값 (max_regenerations는 명령줄 인자로 지정)
+WORKFLOW_SETTINGS: Dict[str, Any] = {
+    "num_candidates": 1,
+    "enable_backtranslation": True,
+    "timeout_seconds": 120,
+    "max_node_executions": 15,
+}
+
 
 # =============================================================================
 # 유틸리티 함수
 # =============================================================================
 def log_header(*lines: str) -> None:
     """구분선으로 감싼 헤더 출력"""
-    logger.info(f"\n{'='*60}")
+    logger.info(_SEP_NL)
     for line in lines:
         logger.info(line)
-    logger.info("="*60)
+    logger.info(_SEP)
 
 
 def log_section(title: str) -> None:
@@ -84,16 +139,32 @@ def log_section(title: str) -> None:
     logger.info(f"\n--- {title} ---")
 
 
+def _trunc(s: str, n: int = 60) -> str:
+    """n자를 넘으면 잘라서 '...'을 붙임 (짧으면 원본 그대로 반환)"""
+    return s if len(s) <= n else s[:n] + "..."
+
+
+def write_stdout_bytes(payload: bytes) -> None:
+    """UTF-8 bytes를 stdout에 직접 출력 (바이너리 버퍼가 없으면 디코딩 후 출력)"""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(payload.decode("utf-8") + "\n")
+        return
+    sys.stdout.flush()  # 앞서 print한 텍스트가 먼저 나가도록
+    buffer.write(payload + b"\n")
+    buffer.flush()
+
+
 def print_json_block(title: str, data: dict, summary_only: bool = False) -> None:
-    """JSON 블록 출력 (summary_only=True면 details 제외)"""
-    print(f"\n{'='*60}")
-    print(title)
-    print("="*60)
-    if summary_only and "details" in data:
-        summary = {k: v for k, v in data.items() if k != "details"}
-        print(json.dumps(summary, ensure_ascii=False, indent=2))
-    else:
-        print(json.dumps(data, ensure_ascii=False, indent=2))
+    """JSON 블록 출력 (summary_only=True면 details 제외, 제목과 본문을 한 번에 씀)"""
+    from src.utils.result_formatter import dumps_json
+
+    header = f"{_SEP_NL}\n{title}\n{_SEP}\n".encode("utf-8")
+    if summary_only:
+        # 호출자의 dict는 건드리지 않음 (save_result와 같은 dict를 공유)
+        data = {k: v for k, v in data.items() if k != "details"}
+    payload = dumps_json(data)
+    write_stdout_bytes(header + payload)
 
 
 def load_test_units(json_path: Path = None) -> List[TranslationUnit]:
@@ -101,6 +172,8 @@ def load_test_units(json_path: Path = None) -> List[TranslationUnit]:
     if json_path is None:
         json_path = EXAMPLES_DIR / "single" / "default.json"
 
+    from src.models import TranslationUnit
+
     with open(json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
@@ -108,88 +181,113 @@ def load_test_units(json_path: Path = None) -> List[TranslationUnit]:
 
 
 def get_timestamp() -> str:
-    """타임스탬프 생성"""
-    now = datetime.now()
-    return now.strftime("%Y-%m-%d-%H-%M-%S") + f"-{now.microsecond // 1000:03d}"
+    """타임스탬프 생성 (YYYY-MM-DD-HH-MM-SS-mmm)"""
+    t = time.time_ns()
+    secs, ms = t // 1_000_000_000, (t // 1_000_000) % 1000
+    return time.strftime("%Y-%m-%d-%H-%M-%S", time.localtime(secs)) + f"-{ms:03d}"
+
+
+def save_result(
+    result: dict,
+    run_dir: Path,
+    formatted: dict = None
+) -> Path:
+    """
+    단일 결과를 JSON 파일로 저장 (formatted가 있으면 포맷팅 생략, 들여쓰기 없는 compact JSON)
 
+    run_dir는 첫 저장 시점에 생성됩니다 (저장할 결과가 없으면 디렉토리를 만들지 않음).
+    """
+    from src.utils.result_formatter import format_workflow_result, dumps_json
 
-def save_result(result: dict, run_dir: Path) -> Path:
-    """단일 결과를 JSON 파일로 저장"""
     key = result["unit"].key
     file_path = run_dir / f"{key}.json"
 
-    output = format_workflow_result(result)
+    output = formatted if formatted is not None else format_workflow_result(result)
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    # 결과 파일은 기계가 읽으므로 compact로 저장 (들여쓰기는 stdout 출력에만 사용)
+    payload = dumps_json(output, indent=False)
+    try:
+        file_path.write_bytes(payload)
+    except FileNotFoundError:
+        # 첫 저장: 디렉토리가 없을 때만 생성 후 재시도 (이후 저장은 mkdir 호출 없음)
+        run_dir.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(payload)
 
     return file_path
 
 
 def log_single_result(result: dict) -> None:
     """단일 번역 결과를 트리 형태로 출력"""
+    from src.utils.pricing import calculate_workflow_cost
+
     m = result.get('metrics')
     total_ms = m.total_latency_ms if m else 0
     attempt = result.get('attempt_count', 1)
     state = result['workflow_state'].value
 
+    # 출력 줄을 모아 마지막에 한 번에 씀 (print 호출마다의 stdout 쓰기 제거)
+    out: List[str] = []
+
     # 상태 아이콘
     icon = {"published": "✅", "pending_review": "⚠️", "rejected": "❌", "failed": "💥"}.get(state, "🔄")
 
     # 헤더
-    print(f"\n{icon} 워크플로우 완료 ({total_ms/1000:.1f}s) [GraphBuilder V2]")
+    out.append(f"\n{icon} 워크플로우 완료 ({total_ms/1000:.1f}s) [GraphBuilder V2]")
 
     # 번역
     if 'translation_result' in result:
         tr = result['translation_result']
-        print(f"├─ 번역: {tr.latency_ms}ms")
-        print(f"│   └─ {tr.translation[:60]}{'...' if len(tr.translation) > 60 else ''}")
+        out.append(f"├─ 번역: {tr.latency_ms}ms")
+        out.append(f"│   └─ {_trunc(tr.translation)}")
 
     # 역번역
     if 'backtranslation_result' in result:
         bt = result['backtranslation_result']
-        print(f"├─ 역번역: {bt.latency_ms}ms")
-        print(f"│   └─ {bt.backtranslation[:60]}{'...' if len(bt.backtranslation) > 60 else ''}")
+        out.append(f"├─ 역번역: {bt.latency_ms}ms")
+        out.append(f"│   └─ {_trunc(bt.backtranslation)}")
 
     # 평가
     if 'agent_results' in result:
         eval_latency = m.evaluation_latency_ms if m else 0
-        print(f"├─ 평가: {eval_latency}ms")
+        out.append(f"├─ 평가: {eval_latency}ms")
         agents = result['agent_results']
         for i, ar in enumerate(agents):
             is_last = (i == len(agents) - 1)
             prefix = "│   └─" if is_last else "│   ├─"
             score_icon = "✓" if ar.score >= 4 else ("△" if ar.score == 3 else "✗")
-            print(f"{prefix} {ar.agent_name}: {ar.score} {score_icon}")
+            out.append(f"{prefix} {ar.agent_name}: {ar.score} {score_icon}")
             if ar.issues and ar.score < 4:
                 issue_prefix = "│       └─" if is_last else "│   │   └─"
-                print(f"{issue_prefix} {ar.issues[0][:50]}...")
+                out.append(f"{issue_prefix} {ar.issues[0][:50]}...")
 
     # 판정
     if 'attempt_history' in result and len(result['attempt_history']) > 1:
-        print(f"└─ 판정 ({attempt}회 시도)")
+        out.append(f"└─ 판정 ({attempt}회 시도)")
         history = result['attempt_history']
         for i, h in enumerate(history):
             is_last = (i == len(history) - 1)
             prefix = "    └─" if is_last else "    ├─"
             scores_str = ", ".join(f"{k}:{v}" for k, v in h['scores'].items())
-            print(f"{prefix} [시도 {h['attempt']}] {h['verdict']} ({scores_str})")
+            out.append(f"{prefix} [시도 {h['attempt']}] {h['verdict']} ({scores_str})")
             if h['message'] and is_last:
-                print(f"        └─ {h['message']}")
+                out.append(f"        └─ {h['message']}")
     elif 'gate_decision' in result:
         gd = result['gate_decision']
-        print(f"└─ 판정: {gd.verdict.value}")
+        out.append(f"└─ 판정: {gd.verdict.value}")
         if gd.message:
-            print(f"    └─ {gd.message}")
+            out.append(f"    └─ {gd.message}")
 
     # 비용
     if m:
         cost = calculate_workflow_cost(m.token_usage)
-        print(f"\n💰 비용: ${cost.total_cost:.4f} | 토큰: {m.token_usage['input']:,}+{m.token_usage['output']:,}")
+        out.append(f"\n💰 비용: ${cost.total_cost:.4f} | 토큰: {m.token_usage['input']:,}+{m.token_usage['output']:,}")
 
     # 오류
     if 'error' in result:
-        print(f"\n❌ 오류: {result['error']}")
+        out.append(f"\n❌ 오류: {result['error']}")
+
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
 
 # =============================================================================
@@ -197,6 +295,9 @@ def log_single_result(result: dict) -> None:
 # =============================================================================
 async def test_single_translation(unit: TranslationUnit, config: TranslationWorkflowConfig) -> dict:
     """단일 번역 테스트 (GraphBuilder V2)"""
+    from src.graph.builder import TranslationWorkflowGraphV2
+    from src.utils.result_formatter import format_workflow_result
+
     log_header(
         f"[GraphBuilder V2] 테스트: {unit.key}",
         f"원문: {unit.source_text[:50]}...",
@@ -210,44 +311,45 @@ async def test_single_translation(unit: TranslationUnit, config: TranslationWork
 
     # 결과 저장
     timestamp = get_timestamp()
-    run_dir = RESULTS_DIR / "single" / timestamp
-    run_dir.mkdir(parents=True, exist_ok=True)
+    run_dir = RESULTS_DIR / "single" / timestamp  # 디렉토리는 save_result에서 생성
+
+    # 한 번만 포맷팅하여 저장과 출력에 같은 dict 사용 (created_at도 자연히 일치)
+    output_dict = format_workflow_result(result)
 
-    file_path = save_result(result, run_dir)
+    # 파일 쓰기는 스레드로 넘겨 이벤트 루프를 막지 않음
+    file_path = await asyncio.to_thread(save_result, result, run_dir, formatted=output_dict)
     logger.info(f"\n📁 결과 저장: {file_path}")
 
     # JSON 출력 (요약만)
-    output_dict = format_workflow_result(result)
     print_json_block("📄 Result JSON:", output_dict, summary_only=True)
 
     return result
 
 
-def test_dry_run(config: TranslationWorkflowConfig):
-    """Dry run - 그래프 구조 확인 (API 호출 없음)"""
+def test_dry_run(settings: Dict[str, Any]):
+    """Dry run - 그래프 구조 확인 (API 호출 없음, src 임포트 없음)"""
     log_header("[GraphBuilder V2] Dry Run: 그래프 구조 확인")
 
-    print(f"\n📋 설정:")
-    print(f"  - max_regenerations: {config.max_regenerations}")
-    print(f"  - num_candidates: {config.num_candidates}")
-    print(f"  - enable_backtranslation: {config.enable_backtranslation}")
-    print(f"  - timeout_seconds: {config.timeout_seconds}")
-    print(f"  - max_node_executions: {config.max_node_executions}")
-
-    print("\n📊 워크플로우 흐름:")
-    print("  TRANSLATE → BACKTRANSLATE → EVALUATE → DECIDE")
-    print("                                           ↓")
-    print("               ┌──────────────────────────┼──────────────────────────┐")
-    print("               ↓                          ↓                          ↓")
-    print("           FINALIZE                  REGENERATE                  FINALIZE")
-    print("          (PASS/BLOCK)              (loop back)                 (ESCALATE)")
-
-    print("\n📦 노드 목록:")
+    out: List[str] = []
+
+    out.append(f"\n📋 설정:")
+    for name, value in settings.items():
+        out.append(f"  - {name}: {value}")
+
+    out.append("\n📊 워크플로우 흐름:")
+    out.append("  TRANSLATE → BACKTRANSLATE → EVALUATE → DECIDE")
+    out.append("                                           ↓")
+    out.append("               ┌──────────────────────────┼──────────────────────────┐")
+    out.append("               ↓                          ↓                          ↓")
+    out.append("           FINALIZE                  REGENERATE                  FINALIZE")
+    out.append("          (PASS/BLOCK)              (loop back)                 (ESCALATE)")
+
+    out.append("\n📦 노드 목록:")
     nodes = ["translate", "backtranslate", "evaluate", "decide", "regenerate", "finalize"]
     for node in nodes:
-        print(f"  - {node}")
+        out.append(f"  - {node}")
 
-    print("\n🔗 엣지 목록:")
+    out.append("\n🔗 엣지 목록:")
     edges = [
         ("translate", "backtranslate", None),
         ("backtranslate", "evaluate", None),
@@ -258,9 +360,12 @@ def test_dry_run(config: TranslationWorkflowConfig):
     ]
     for src, dst, cond in edges:
         cond_str = f" (condition: {cond})" if cond else ""
-        print(f"  - {src} → {dst}{cond_str}")
+        out.append(f"  - {src} → {dst}{cond_str}")
+
+    out.append("\n✅ Dry run 완료")
 
-    print("\n✅ Dry run 완료")
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
 
 # =============================================================================
@@ -278,29 +383,25 @@ async def main():
 
     # DEBUG 모드 설정
     if args.debug:
-        logging.getLogger("src.tools").setLevel(logging.DEBUG)
-        logging.getLogger("src.graph").setLevel(logging.DEBUG)
-        # strands 내부 로그는 숨김
-        logging.getLogger("strands").setLevel(logging.WARNING)
-
-    # 워크플로우 설정
-    config = TranslationWorkflowConfig(
-        max_regenerations=args.max_regen,
-        num_candidates=1,
-        enable_backtranslation=True,
-        timeout_seconds=120
-    )
+        logging.config.dictConfig(DEBUG_LOG_CONFIG)
 
-    # Dry run
+    # 워크플로우 설정값
+    settings = {"max_regenerations": args.max_regen, **WORKFLOW_SETTINGS}
+
+    # Dry run (무거운 모듈 임포트 전에 종료)
     if args.dry_run:
-        test_dry_run(config)
+        test_dry_run(settings)
         return
 
+    from src.graph.builder import TranslationWorkflowConfig
+    config = TranslationWorkflowConfig(**settings)
+    observability_session, otel_available = load_observability_session()
+
     # 테스트 데이터 로드
     input_path = Path(args.input) if args.input else None
     test_units = load_test_units(input_path)
 
-    logger.info(f"OTEL: {'ENABLED' if OTEL_AVAILABLE else 'DISABLED'}")
+    logger.info(f"OTEL: {'ENABLED' if otel_available else 'DISABLED'}")
     logger.info(f"Implementation: Strands GraphBuilder V2")
 
     # Observability 세션으로 실행
@@ -312,9 +413,9 @@ async def main():
         logger.info(f"Session ID: {session['session_id']}")
         await test_single_translation(test_units[0], config)
 
-    if OTEL_AVAILABLE:
+    if otel_available:
         logger.info("View traces: https://console.aws.amazon.com/cloudwatch/home#gen-ai-observability")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())